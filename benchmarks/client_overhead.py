@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+"""
+Measure the Python overhead of the client on every request, without any network time.
+
+Requests are answered by an ``httpx.MockTransport`` returning a prebuilt response, so the
+numbers only reflect the work done by the driver: packing endpoint arguments, filtering
+options (``_build_request``), building the auth header, dispatching on the HTTP method,
+checking the response and decoding its body. Both the typed ``endpoints`` and the legacy
+``endpoints_old`` API are measured through the sync and async drivers.
+
+The cases differ by two orders of magnitude (a few microseconds for ``_build_request``,
+hundreds for an endpoint call), so they are gated separately, and the script exits with status 1
+when a case is over its limit:
+
+- ``--budget`` takes a JSON file mapping case names to their maximum microseconds per call,
+  the cases missing from it aren't gated
+- ``--baseline`` takes the results of a previous run saved with ``--save`` and fails the cases
+  slower than their baseline by more than ``--tolerance`` (a fraction, 0.5 = 50% slower)
+
+Usage:
+    python benchmarks/client_overhead.py --number 2000 --save baseline.json
+    python benchmarks/client_overhead.py --number 2000 --baseline baseline.json --tolerance 0.5
+    python benchmarks/client_overhead.py --budget budgets.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import warnings
+
+import httpx
+
+from mattermostautodriver import AsyncDriver, AsyncTypedDriver, Driver, TypedDriver
+from mattermostautodriver.client import BaseClient
+
+CHANNEL_ID = "benchmarkchannelid000000000"
+
+USER = {"id": "benchmarkuserid00000000000", "username": "benchmark", "email": "benchmark@example.com"}
+POST = {"id": "benchmarkpostid00000000000", "channel_id": CHANNEL_ID, "message": "benchmark"}
+POSTS = {"order": [POST["id"]], "posts": {POST["id"]: POST}}
+
+DRIVER_OPTIONS = {
+    "url": "localhost",
+    "token": "benchmarktoken",
+    "rate_limit": False,
+}
+
+
+def handler(request):
+    if request.method == "POST":
+        body = POST
+    elif request.url.path.endswith("/posts"):
+        body = POSTS
+    else:
+        body = USER
+    return httpx.Response(200, headers={"Content-Type": "application/json"}, content=json.dumps(body).encode())
+
+
+def make_driver(driver_cls, options):
+    with warnings.catch_warnings():
+        # Driver and AsyncDriver warn about the deprecated legacy API, which is measured on purpose
+        warnings.simplefilter("ignore", DeprecationWarning)
+        driver = driver_cls({**DRIVER_OPTIONS, **options})
+    if driver_cls in (AsyncDriver, AsyncTypedDriver):
+        driver.client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    else:
+        driver.client.client = httpx.Client(transport=httpx.MockTransport(handler))
+    return driver
+
+
+def client_cases(client):
+    response = httpx.Response(200, request=httpx.Request("GET", "http://localhost/api/v4/users/me"))
+    options = {"channel_id": CHANNEL_ID, "message": "benchmark", "root_id": None, "file_ids": None}
+    params = {"page": 0, "per_page": 60, "since": None, "before": None}
+
+    return {
+        "auth_header": lambda: client.auth_header(),
+        "_get_request_method": lambda: BaseClient._get_request_method("post", client.client),
+        "_build_request get": lambda: client._build_request("get", params=params),
+        "_build_request post": lambda: client._build_request("post", options=options),
+        "_check_response": lambda: BaseClient._check_response(response),
+    }
+
+
+def sync_endpoint_cases(typed, legacy):
+    return {
+        "typed get_user": lambda: typed.users.get_user("me"),
+        "legacy get_user": lambda: legacy.users.get_user("me"),
+        "typed get_posts_for_channel": lambda: typed.posts.get_posts_for_channel(CHANNEL_ID, page=0, per_page=60),
+        "legacy get_posts_for_channel": lambda: legacy.posts.get_posts_for_channel(
+            CHANNEL_ID, params={"page": 0, "per_page": 60}
+        ),
+        "typed create_post": lambda: typed.posts.create_post(CHANNEL_ID, "benchmark"),
+        "legacy create_post": lambda: legacy.posts.create_post({"channel_id": CHANNEL_ID, "message": "benchmark"}),
+    }
+
+
+def async_endpoint_cases(typed, legacy):
+    return {
+        "async " + name: call
+        for name, call in {
+            "typed get_user": lambda: typed.users.get_user("me"),
+            "legacy get_user": lambda: legacy.users.get_user("me"),
+            "typed create_post": lambda: typed.posts.create_post(CHANNEL_ID, "benchmark"),
+            "legacy create_post": lambda: legacy.posts.create_post({"channel_id": CHANNEL_ID, "message": "benchmark"}),
+        }.items()
+    }
+
+
+def measure(call, number, repeat):
+    """
+    :return: The fastest time of ``repeat`` runs of ``number`` calls, in microseconds per call
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            call()
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1e6
+
+
+async def async_measure(call, number, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            await call()
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=2000, help="calls per run")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case, the fastest one is reported")
+    parser.add_argument("--json-backend", default="auto", help="value of the json_backend driver option")
+    parser.add_argument("--budget", help="JSON file with the maximum microseconds per call of each case")
+    parser.add_argument("--baseline", help="JSON file with the results of a previous run saved with --save")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.5, help="slowdown allowed against the baseline, as a fraction"
+    )
+    parser.add_argument("--save", help="write the microseconds per call of each case to this JSON file")
+    args = parser.parse_args()
+
+    limits = {}
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            limits = {name: elapsed * (1 + args.tolerance) for name, elapsed in json.load(f).items()}
+    if args.budget is not None:
+        with open(args.budget) as f:
+            limits.update(json.load(f))
+
+    options = {"json_backend": args.json_backend}
+    typed, legacy = make_driver(TypedDriver, options), make_driver(Driver, options)
+    async_typed, async_legacy = make_driver(AsyncTypedDriver, options), make_driver(AsyncDriver, options)
+
+    results = {}
+    for name, call in {**client_cases(typed.client), **sync_endpoint_cases(typed, legacy)}.items():
+        results[name] = measure(call, args.number, args.repeat)
+
+    async def run_async():
+        for name, call in async_endpoint_cases(async_typed, async_legacy).items():
+            results[name] = await async_measure(call, args.number, args.repeat)
+        await async_typed.client.close()
+        await async_legacy.client.close()
+
+    asyncio.run(run_async())
+    typed.client.close()
+    legacy.client.close()
+
+    print(f"json backend: {typed.client.codec.name}, {args.number} calls x {args.repeat} runs")
+    print(f"{'case':<40} {'us/call':>10} {'limit':>10}")
+    over_budget = []
+    for name, elapsed in results.items():
+        limit = limits.get(name)
+        flag = ""
+        if limit is not None and elapsed > limit:
+            over_budget.append(name)
+            flag = "  over limit"
+        limit = f"{limit:.2f}" if limit is not None else "-"
+        print(f"{name:<40} {elapsed:>10.2f} {limit:>10}{flag}")
+
+    if args.save is not None:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if over_budget:
+        print(f"{len(over_budget)} case(s) over their limit: {', '.join(over_budget)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+"""
+Measure the cold start cost of the package: the time taken by ``import mattermostautodriver``,
+broken down by module with ``python -X importtime``, and the current resident memory of a process
+after importing it, creating a TypedDriver and an AsyncTypedDriver and using all their endpoints.
+
+Every measure is made in a fresh interpreter. The import time reported is the median of ``--runs`` runs.
+Resident memory is read from ``/proc/self/statm``, or with ``psutil`` where there is no ``/proc``.
+
+With ``--import-budget`` (milliseconds) or ``--rss-budget`` (MiB) the script exits with status 1
+when the import time or the resident memory after creating the drivers exceed the budget,
+so it can be used as a regression gate when endpoints are regenerated.
+
+Usage: python benchmarks/import_time.py --runs 5 --import-budget 500 --rss-budget 60
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+PACKAGE = "mattermostautodriver"
+
+RSS_SCRIPT = """
+import json, os
+
+# The current resident memory, ru_maxrss would give the peak of the process, which never goes down
+if os.path.exists("/proc/self/statm"):
+    def rss():
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+else:
+    # Without /proc (e.g. macOS), psutil is imported before the first measure so it counts in every stage
+    import psutil
+
+    def rss():
+        return psutil.Process().memory_info().rss / 1024 / 1024
+
+result = {"interpreter": rss()}
+import mattermostautodriver
+from mattermostautodriver import TypedDriver, AsyncTypedDriver
+result["import"] = rss()
+drivers = [TypedDriver({"url": "localhost"}), AsyncTypedDriver({"url": "localhost"})]
+result["drivers"] = rss()
+from mattermostautodriver.driver.lazy_endpoint import LazyEndpoint
+for driver in drivers:
+    for cls in type(driver).__mro__:
+        for name, value in vars(cls).items():
+            if isinstance(value, LazyEndpoint):
+                getattr(driver, name)
+result["all endpoints"] = rss()
+print(json.dumps(result))
+"""
+
+
+def import_times():
+    """
+    :return: A dict of the self import time of each module in microseconds and the total import time of the package
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {PACKAGE}"], capture_output=True, text=True, check=True
+    )
+    modules = {}
+    total = None
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, cumulative, name = (part.strip() for part in line[len("import time:") :].split("|"))
+        modules[name] = int(self_time)
+        if name == PACKAGE:
+            total = int(cumulative)
+    return modules, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters used to measure the import time")
+    parser.add_argument("--top", type=int, default=15, help="number of slowest modules listed")
+    parser.add_argument("--import-budget", type=float, help="maximum import time in milliseconds")
+    parser.add_argument("--rss-budget", type=float, help="maximum resident memory in MiB after creating the drivers")
+    args = parser.parse_args()
+
+    totals = []
+    per_module = defaultdict(list)
+    for _ in range(args.runs):
+        modules, total = import_times()
+        totals.append(total)
+        for name, self_time in modules.items():
+            per_module[name].append(self_time)
+
+    median = {name: statistics.median(times) for name, times in per_module.items()}
+    by_package = defaultdict(float)
+    for name, self_time in median.items():
+        top_level = name.split(".")[0]
+        # Show the modules of the package one level deeper, e.g. mattermostautodriver.endpoints
+        if top_level == PACKAGE and "." in name:
+            top_level = ".".join(name.split(".")[:2])
+        by_package[top_level] += self_time
+
+    import_ms = statistics.median(totals) / 1000
+    print(f"import {PACKAGE}: {import_ms:.1f}ms (median of {args.runs} runs)")
+    print(f"\n{'package':<45} {'self ms':>10}")
+    for name, self_time in sorted(by_package.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"{name:<45} {self_time / 1000:>10.1f}")
+
+    process = subprocess.run([sys.executable, "-c", RSS_SCRIPT], capture_output=True, text=True, check=True)
+    rss = json.loads(process.stdout)
+    print(f"\n{'resident memory after':<45} {'MiB':>10}")
+    for stage, value in rss.items():
+        print(f"{stage:<45} {value:>10.1f}")
+
+    failed = []
+    if args.import_budget is not None and import_ms > args.import_budget:
+        failed.append(f"import time {import_ms:.1f}ms is over the budget of {args.import_budget}ms")
+    if args.rss_budget is not None and rss["drivers"] > args.rss_budget:
+        failed.append(f"resident memory {rss['drivers']:.1f}MiB is over the budget of {args.rss_budget}MiB")
+
+    if failed:
+        print("\n".join(failed), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
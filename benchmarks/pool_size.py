@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""
+Measure the throughput of the AsyncTypedDriver for different connection pool sizes.
+
+A local HTTP server answering every request after a fixed latency stands in for
+Mattermost, so the numbers only reflect how many requests can be in flight at once.
+
+Usage: python benchmarks/pool_size.py --pool-sizes 10 20 50 100 200 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from mattermostautodriver import AsyncTypedDriver
+
+
+def start_server(latency):
+    body = json.dumps({"id": "benchmarkuserid", "username": "benchmark"}).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    server.request_queue_size = 1024
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def run(port, pool_size, requests, concurrency):
+    driver = AsyncTypedDriver(
+        {
+            "url": "127.0.0.1",
+            "port": port,
+            "scheme": "http",
+            "token": "benchmark",
+            "max_connections": pool_size,
+            "max_keepalive_connections": pool_size,
+            "rate_limit": False,
+        }
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call():
+        async with semaphore:
+            await driver.users.get_user("me")
+
+    async with driver:
+        start = time.perf_counter()
+        await asyncio.gather(*(call() for _ in range(requests)))
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[1, 10, 20, 50, 100, 200])
+    parser.add_argument("--requests", type=int, default=2000, help="requests sent for each pool size")
+    parser.add_argument("--concurrency", type=int, default=200, help="requests in flight at once")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds the server takes to answer")
+    args = parser.parse_args()
+
+    server = start_server(args.latency)
+    port = server.server_address[1]
+
+    print(f"{args.requests} requests, {args.concurrency} concurrent, {args.latency * 1000:.0f}ms server latency")
+    print(f"{'pool size':>10} {'seconds':>10} {'requests/s':>12}")
+
+    for pool_size in args.pool_sizes:
+        elapsed = asyncio.run(run(port, pool_size, args.requests, args.concurrency))
+        print(f"{pool_size:>10} {elapsed:>10.2f} {args.requests / elapsed:>12.0f}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ class ASTEndpointParser:
         base_driver_class_name: str,
         driver_file_path: str = os.path.join("driver", "endpoint_base.py"),
         modify_module_class_name: Callable[[str], str] | None = None,
+        legacy: bool = False,
     ):
         module_path = os.path.join(
             os.path.dirname(os.path.abspath(__file__)),
@@ -25,6 +26,9 @@ class ASTEndpointParser:
         self.endpoints_dir = endpoints_dir
         self.endpoints_path = os.path.join(module_path, endpoints_dir)
         self.modify_module_class_name = modify_module_class_name
+        # The legacy driver uses the same endpoint classes through the runtime adapter of endpoints_old,
+        # which has no class to import for type hints
+        self.legacy = legacy
 
     def parse_file(self) -> ast.Module:
         """Parse the Python file and return the AST."""
@@ -71,17 +75,23 @@ class ASTEndpointParser:
 
         return sorted(endpoints)  # Sort for consistent ordering
 
-    def remove_existing_endpoint_imports(self, tree: ast.Module) -> ast.Module:
+    def find_type_checking_block(self, tree: ast.Module) -> ast.If:
+        """Find the ``if TYPE_CHECKING:`` block holding the imports used for type hints."""
+        for node in tree.body:
+            if isinstance(node, ast.If) and isinstance(node.test, ast.Name) and node.test.id == "TYPE_CHECKING":
+                return node
+        raise ValueError("if TYPE_CHECKING: block not found in the file")
+
+    def remove_existing_endpoint_imports(self, block: ast.If) -> ast.If:
         """
-        Remove all existing endpoint imports from the AST.
+        Remove all existing endpoint imports from the ``if TYPE_CHECKING:`` block.
 
         Returns:
-            Modified AST with endpoint imports removed
+            Modified block with endpoint imports removed
         """
-        # Filter out endpoint imports
-        tree.body = [
+        block.body = [
             node
-            for node in tree.body
+            for node in block.body
             if not (
                 isinstance(node, ast.ImportFrom)
                 and node.module
@@ -89,35 +99,43 @@ class ASTEndpointParser:
                 and node.names
             )
         ]
-        return tree
+        return block
 
     def create_import_node(self, module_name: str, class_name: str) -> ast.ImportFrom:
         return ast.ImportFrom(
-            module=f"..{self.endpoints_dir}.{module_name}",
+            module=f"{self.endpoints_dir}.{module_name}",
             names=[
                 ast.alias(
                     name=class_name,
                     asname=self.modify_module_class_name(class_name) if self.modify_module_class_name else None,
                 )
             ],
-            level=0,
+            level=2,
         )
 
-    def create_assignment_node(self, module_name: str, class_name: str) -> ast.Assign:
+    def create_assignment_node(self, module_name: str, class_name: str) -> ast.AnnAssign | ast.Assign:
+        """
+        Create the class attribute giving the endpoint instance, e.g.
+        ``users: "Users" = LazyEndpoint("mattermostautodriver.endpoints.users", "Users")``
+        or ``users = LazyEndpoint("mattermostautodriver.endpoints.users", "Users", legacy=True)``
+        """
         attr_name = module_name.lower()
-
-        return ast.Assign(
-            targets=[ast.Attribute(value=ast.Name(id="self", ctx=ast.Load()), attr=attr_name, ctx=ast.Store())],
-            value=ast.Call(
-                func=ast.Name(
-                    id=self.modify_module_class_name(class_name) if self.modify_module_class_name else class_name,
-                    ctx=ast.Load(),
-                ),
-                args=[ast.Attribute(value=ast.Name(id="self", ctx=ast.Load()), attr="client", ctx=ast.Load())],
-                keywords=[],
-            ),
+        target = ast.Name(id=attr_name, ctx=ast.Store())
+        value = ast.Call(
+            func=ast.Name(id="LazyEndpoint", ctx=ast.Load()),
+            args=[
+                ast.Constant(value=f"mattermostautodriver.{self.endpoints_dir}.{module_name}"),
+                ast.Constant(value=class_name),
+            ],
+            keywords=[ast.keyword(arg="legacy", value=ast.Constant(value=True))] if self.legacy else [],
         )
 
+        if self.legacy:
+            return ast.Assign(targets=[target], value=value)
+
+        hint = self.modify_module_class_name(class_name) if self.modify_module_class_name else class_name
+        return ast.AnnAssign(target=target, annotation=ast.Constant(value=hint), value=value, simple=1)
+
     def find_base_driver_with_endpoints_class(self, tree: ast.Module) -> ast.ClassDef:
         """Find the base driver class in the AST."""
         for node in ast.walk(tree):
@@ -125,52 +143,26 @@ class ASTEndpointParser:
                 return node
         raise ValueError(f"{self.base_driver_class_name} class not found in the file")
 
-    def find_init_method(self, class_node: ast.ClassDef) -> ast.FunctionDef:
-        """Find the __init__ method in a class node."""
-        for node in class_node.body:
-            if isinstance(node, ast.FunctionDef) and node.name == "__init__":
-                return node
-        raise ValueError(f"__init__ method not found in {self.base_driver_class_name} class")
-
-    def remove_existing_endpoint_assignments(self, init_method: ast.FunctionDef) -> ast.FunctionDef:
-        """Remove existing endpoint assignments from the __init__ method."""
-        # Filter out endpoint assignments
-        init_method.body = [
+    def remove_existing_endpoint_assignments(self, class_node: ast.ClassDef) -> ast.ClassDef:
+        """Remove existing endpoint attributes from the class body."""
+        class_node.body = [
             node
-            for node in init_method.body
+            for node in class_node.body
             if not (
-                isinstance(node, ast.Assign)
-                and any(
-                    isinstance(target, ast.Attribute)
-                    and isinstance(target.value, ast.Name)
-                    and target.value.id == "self"
-                    and isinstance(node.value, ast.Call)
-                    and isinstance(node.value.func, ast.Name)
-                    and len(node.value.args) == 1
-                    and isinstance(node.value.args[0], ast.Attribute)
-                    for target in node.targets
-                )
+                isinstance(node, (ast.AnnAssign, ast.Assign))
+                and isinstance(node.value, ast.Call)
+                and isinstance(node.value.func, ast.Name)
+                and node.value.func.id == "LazyEndpoint"
             )
         ]
-        return init_method
-
-    def find_super_call_index(self, init_method: ast.FunctionDef) -> int:
-        """Find the index where super().__init__() is called."""
-        for i, node in enumerate(init_method.body):
-            if isinstance(node, ast.Expr) and isinstance(node.value, ast.Call):
-                call = node.value
-                # Check for super() call patterns
-                if isinstance(call.func, ast.Attribute) and call.func.attr in ["__init__", "init"]:
-                    if isinstance(call.func.value, ast.Call):
-                        func_call = call.func.value
-                        if isinstance(func_call.func, ast.Name) and func_call.func.id == "super":
-                            return i + 1
-
-        return 1  # Default to after first statement
+        return class_node
 
     def update_ast(self, tree: ast.Module, discovered_endpoints: list[tuple[str, str]]) -> ast.Module:
         """
-        Update the AST by removing all existing endpoint imports/assignments and adding new ones.
+        Update the AST by removing all existing endpoint imports/attributes and adding new ones.
+
+        Endpoint modules are only imported for type checking, the driver classes import them
+        when an endpoint is first used through ``LazyEndpoint``.
 
         Args:
             tree: The original AST
@@ -179,44 +171,20 @@ class ASTEndpointParser:
         Returns:
             Updated AST
         """
-        # Remove all existing endpoint imports
-        tree = self.remove_existing_endpoint_imports(tree)
-
-        # Create all new imports
-        new_imports = [
-            self.create_import_node(module_name, class_name) for module_name, class_name in discovered_endpoints
-        ]
-
-        # Find where to insert imports (after existing imports but before class definitions)
-        insert_index = 0
-        for i, node in enumerate(tree.body):
-            if isinstance(node, (ast.Import, ast.ImportFrom)):
-                insert_index = i + 1
-            elif isinstance(node, ast.ClassDef):
-                break
-
-        # Insert all new imports
-        for import_node in reversed(new_imports):  # Reverse to maintain order
-            tree.body.insert(insert_index, import_node)
+        if not self.legacy:
+            block = self.find_type_checking_block(tree)
+            block = self.remove_existing_endpoint_imports(block)
+            block.body.extend(
+                self.create_import_node(module_name, class_name) for module_name, class_name in discovered_endpoints
+            )
 
-        # Update the base driver class
         class_node = self.find_base_driver_with_endpoints_class(tree)
-        init_method = self.find_init_method(class_node)
-
-        # Remove all existing endpoint assignments
-        init_method = self.remove_existing_endpoint_assignments(init_method)
-
-        # Find where to insert new assignments (after super().__init__ call)
-        insert_index = self.find_super_call_index(init_method)
-
-        # Create all new assignment nodes
-        new_assignments = [
+        class_node = self.remove_existing_endpoint_assignments(class_node)
+        class_node.body.extend(
             self.create_assignment_node(module_name, class_name) for module_name, class_name in discovered_endpoints
-        ]
-
-        # Insert all new assignments
-        for assignment in reversed(new_assignments):  # Reverse to maintain order
-            init_method.body.insert(insert_index, assignment)
+        )
+        # Endpoints are all defined on the class, remove the placeholder body
+        class_node.body = [node for node in class_node.body if not isinstance(node, ast.Pass)] or [ast.Pass()]
 
         return tree
 
@@ -247,9 +215,7 @@ def main():
         endpoints_dir="endpoints", base_driver_class_name="TypedBaseDriverWithEndpoints"
     )
     untyped_driver_parser = ASTEndpointParser(
-        endpoints_dir="endpoints_old",
-        base_driver_class_name="BaseDriverWithEndpoints",
-        modify_module_class_name=lambda x: "Old" + x,
+        endpoints_dir="endpoints", base_driver_class_name="BaseDriverWithEndpoints", legacy=True
     )
 
     typed_driver_parser.update_file()
@@ -11,21 +11,19 @@ set -eu
 
 STORE_DIR="mattermostautodriver"
 
-for DEST in "endpoints" "endpoints_old"; do
-    rm -f src/$STORE_DIR/$DEST/*.py
-    touch src/$STORE_DIR/$DEST/__init__.py
+DEST="endpoints"
 
-    cat << EOF > src/$STORE_DIR/$DEST/_base.py
+# The legacy endpoints (endpoints_old.py) are built from these ones at runtime
+rm -f src/$STORE_DIR/$DEST/*.py
+touch src/$STORE_DIR/$DEST/__init__.py
+
+cat << EOF > src/$STORE_DIR/$DEST/_base.py
 class Base:
     def __init__(self, client):
         self.client = client
 EOF
-done
-
-color "Generating deprecated-style endpoints"
-python bin/generate_endpoints_ast_deprecated.py
 
-color "Generating new API endpoints"
+color "Generating API endpoints"
 python bin/generate_endpoints_ast.py
 
 color "Updating driver"
@@ -0,0 +1,117 @@
+"""
+Helpers to run many endpoint calls at once with a bounded number of requests in flight
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from .constants import DEFAULT_CONCURRENCY
+from .exceptions import BulkError
+
+
+def _check_results(results, return_exceptions):
+    """
+    :raises BulkError: If exceptions aren't returned and some of the calls failed
+    """
+    if not return_exceptions:
+        failed = sum(isinstance(result, Exception) for result in results)
+        if failed:
+            raise BulkError(f"{failed} of {len(results)} calls failed", results)
+    return results
+
+
+def gather(calls, concurrency=DEFAULT_CONCURRENCY, return_exceptions=True):
+    """
+    Run ``calls`` in a pool of ``concurrency`` threads.
+
+    The ``httpx.Client`` of a driver is thread safe, so the calls can share a single driver
+    and its connection pool. Keep ``concurrency`` below the ``max_connections`` option of the driver,
+    threads waiting for a free connection count against ``pool_timeout``.
+
+    A failing call doesn't stop the others.
+
+    .. code:: python
+
+        from functools import partial
+        from mattermostautodriver.bulk import gather
+
+        users = gather([partial(driver.users.get_user, user_id) for user_id in user_ids], concurrency=20)
+
+    :param calls: Callables taking no argument, such as endpoints of a ``TypedDriver`` wrapped with ``functools.partial``
+    :param concurrency: The maximum number of calls running at once
+    :param return_exceptions: Return the exception raised by a call in place of its result.
+        Otherwise :class:`~mattermostautodriver.exceptions.BulkError` is raised once all calls are done
+        if any of them failed.
+    :return: A list with the result or the exception raised by each call, in the order of ``calls``
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    calls = list(calls)
+    if not calls:
+        return []
+
+    executor = ThreadPoolExecutor(max_workers=min(concurrency, len(calls)), thread_name_prefix="mattermostautodriver")
+    try:
+        futures = [executor.submit(call) for call in calls]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+    finally:
+        # Don't start the remaining calls if we were interrupted
+        executor.shutdown(cancel_futures=True)
+
+    return _check_results(results, return_exceptions)
+
+
+async def async_gather(calls, concurrency=DEFAULT_CONCURRENCY, return_exceptions=True):
+    """
+    Run ``calls`` with at most ``concurrency`` of them in flight at once.
+
+    A failing call doesn't cancel the others.
+
+    .. code:: python
+
+        from mattermostautodriver.bulk import async_gather
+
+        users = await async_gather((driver.users.get_user(user_id) for user_id in user_ids), concurrency=20)
+
+    :param calls: Awaitables, such as the coroutines returned by the endpoints of an ``AsyncTypedDriver``,
+        or callables taking no argument and returning one. Callables are only called when a slot is free.
+    :param concurrency: The maximum number of calls running at once
+    :param return_exceptions: Return the exception raised by a call in place of its result.
+        Otherwise :class:`~mattermostautodriver.exceptions.BulkError` is raised once all calls are done
+        if any of them failed.
+    :return: A list with the result or the exception raised by each call, in the order of ``calls``
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    calls = list(calls)
+    results = [None] * len(calls)
+    # Shared by the workers, each one takes the next call once it is done with the previous one
+    pending = iter(range(len(calls)))
+
+    async def worker():
+        for index in pending:
+            call = calls[index]
+            try:
+                results[index] = await (call() if callable(call) else call)
+            except Exception as e:
+                results[index] = e
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(min(concurrency, len(calls)))]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+        # Close the coroutines never started when cancelled, so they don't warn about never being awaited
+        for index in pending:
+            if asyncio.iscoroutine(calls[index]):
+                calls[index].close()
+
+    return _check_results(results, return_exceptions)
@@ -0,0 +1,380 @@
+"""
+Client side caches of server responses
+"""
+
+import copy
+import json
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from .constants import ENTITY_CACHE_TTL, ID_PATTERN
+
+
+class ETagCache:
+    """
+    Least recently used cache of decoded responses and the ``ETag`` they were sent with,
+    used to make conditional requests with ``If-None-Match``.
+
+    Cached responses are returned as is to every caller and should be treated as read-only.
+    """
+
+    def __init__(self, maxsize=256):
+        """
+        :param maxsize: The maximum number of responses kept, the least recently used ones are evicted first
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        :return: A tuple with the ETag and the decoded response cached for ``key`` or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, etag, value):
+        """
+        Cache the decoded response ``value`` sent with ``etag`` for ``key``.
+        """
+        with self._lock:
+            self._entries[key] = (etag, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached responses"""
+        with self._lock:
+            self._entries.clear()
+
+
+class TTLCache:
+    """
+    Least recently used cache whose entries expire ``ttl`` seconds after being set.
+
+    Cached values are returned as is to every caller and should be treated as read-only.
+    """
+
+    def __init__(self, ttl, maxsize=None):
+        """
+        :param ttl: Seconds after which an entry expires
+        :param maxsize: The maximum number of entries kept, the least recently used ones are evicted first,
+            or None for no limit
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """
+        :return: The value cached for ``key`` or ``default`` if there is none or it expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value):
+        """
+        Cache ``value`` for ``key`` for the next ``ttl`` seconds.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """
+        Remove the entry cached for ``key``.
+
+        :return: The value that was cached for ``key``, even if expired, or ``default``
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self):
+        """Remove all cached entries"""
+        with self._lock:
+            self._entries.clear()
+
+
+_ID = f"({ID_PATTERN})"
+
+#: GET endpoints served by ``EntityCache``: pattern, kind of entity and whether the path gives its id or its name
+_ENTITY_LOOKUPS = (
+    (re.compile(rf"/api/v4/users/{_ID}"), "users", "id"),
+    (re.compile(r"/api/v4/users/username/([^/]+)"), "users", "name"),
+    (re.compile(rf"/api/v4/channels/{_ID}"), "channels", "id"),
+    (re.compile(rf"/api/v4/teams/{_ID}/channels/name/([^/]+)"), "channels", "name"),
+    (re.compile(rf"/api/v4/teams/{_ID}"), "teams", "id"),
+    (re.compile(r"/api/v4/teams/name/([^/]+)"), "teams", "name"),
+)
+
+# Requests other than GET to these paths and the paths below them may modify the entity
+_ENTITY_WRITE = re.compile(rf"/api/v4/(users|channels|teams)/(?:{_ID}|(me))(?:/|$)")
+
+
+#: Websocket events after which :meth:`EntityCache.handle_event` evicts or replaces cached entities
+ENTITY_EVENTS = frozenset(
+    {
+        "user_updated",
+        "user_role_updated",
+        "channel_updated",
+        "channel_deleted",
+        "channel_restored",
+        "channel_converted",
+        "channel_scheme_updated",
+        "user_added",
+        "user_removed",
+        "update_team",
+        "delete_team",
+        "update_team_scheme",
+        "added_to_team",
+        "leave_team",
+    }
+)
+
+
+def _entity_name(kind, entity):
+    """
+    :return: The key under which ``entity`` is looked up by name
+    """
+    if kind == "users":
+        return entity.get("username")
+    if kind == "channels":
+        return entity.get("team_id"), entity.get("name")
+    return entity.get("name")
+
+
+class EntityCache:
+    """
+    Cache of the users, channels and teams returned by ``Users.get_user``, ``Users.get_user_by_username``,
+    ``Channels.get_channel``, ``Channels.get_channel_by_name``, ``Teams.get_team`` and ``Teams.get_team_by_name``.
+
+    Each kind of entity is kept in a :class:`TTLCache` with its own expiry, and lookups by name
+    go through an index of the ids, so an entity fetched by name is found by id and the other way around.
+    An entity is evicted when a request other than GET is made to its path or below it
+    (e.g. ``PUT /api/v4/users/{user_id}/patch``) by the client it is installed on, and the websocket
+    of the drivers keeps it up to date with the changes made by others, see :meth:`handle_event`.
+
+    Enabled with the ``entity_cache`` option of the drivers and available as ``driver.client.entity_cache``.
+    Entities are copied when cached and when returned, so callers may modify them. The client it is installed on
+    evicts every entity when its token changes, as what a user is allowed to see depends on who is logged in.
+    """
+
+    KINDS = ("users", "channels", "teams")
+
+    def __init__(self, ttl=None, maxsize=1000):
+        """
+        :param ttl: Seconds after which an entity expires, either one number for every kind or a dict by kind,
+            the kinds missing from the dict use :data:`~mattermostautodriver.constants.ENTITY_CACHE_TTL`
+        :param maxsize: The maximum number of entities kept for each kind,
+            the least recently used ones are evicted first
+        """
+        if not isinstance(ttl, dict):
+            ttl = dict.fromkeys(self.KINDS, ttl) if ttl is not None else {}
+        ttl = {**ENTITY_CACHE_TTL, **ttl}
+
+        self._entities = {kind: TTLCache(ttl[kind], maxsize) for kind in self.KINDS}
+        self._names = {kind: TTLCache(ttl[kind], maxsize) for kind in self.KINDS}
+        self._lock = threading.Lock()
+        self._hits = Counter()
+        self._misses = Counter()
+        # Decodes the entities sent as JSON strings in websocket events
+        self._loads = json.loads
+
+    def install(self, client):
+        """
+        Register the hooks evicting the entities modified by the requests of ``client``.
+
+        :param client: The ``Client`` or ``AsyncClient`` of a driver, e.g. ``driver.client``
+        """
+        self._loads = client.codec.loads
+
+        def invalidate(method, endpoint, *args):
+            if method.lower() != "get":
+                self.invalidate_endpoint(endpoint, me=client.userid)
+
+        client.add_hook("after_response", invalidate)
+        client.add_hook("on_error", invalidate)
+
+    @staticmethod
+    def _lookup(endpoint, params):
+        """
+        :return: A tuple with the kind of entity, ``id`` or ``name`` and the key of the entity
+            requested by a GET request to ``endpoint``, or None if the request isn't cached
+        """
+        # Only the default lookups are cached, e.g. not channels requested with include_deleted=True
+        if params and any(value not in (None, False) for value in params.values()):
+            return None
+
+        for pattern, kind, by in _ENTITY_LOOKUPS:
+            match = pattern.fullmatch(endpoint)
+            if match is not None:
+                groups = match.groups()
+                return kind, by, groups[0] if len(groups) == 1 else groups
+        return None
+
+    def get(self, endpoint, params=None):
+        """
+        :return: A copy of the entity cached for a GET request to ``endpoint`` with ``params``, or None
+        """
+        lookup = self._lookup(endpoint, params)
+        if lookup is None:
+            return None
+
+        kind, by, key = lookup
+        entity_id = key if by == "id" else self._names[kind].get(key)
+        entity = self._entities[kind].get(entity_id) if entity_id is not None else None
+
+        with self._lock:
+            if entity is None:
+                self._misses[kind] += 1
+                return None
+            self._hits[kind] += 1
+        return copy.deepcopy(entity)
+
+    def store(self, endpoint, params, entity):
+        """
+        Cache ``entity`` if it is the response to a GET request to ``endpoint`` with ``params`` served by the cache.
+        """
+        if not isinstance(entity, dict) or "id" not in entity:
+            return
+        lookup = self._lookup(endpoint, params)
+        if lookup is not None:
+            self.set(lookup[0], entity)
+
+    def set(self, kind, entity):
+        """
+        Cache a copy of ``entity``, a user, channel or team as returned by the API, by id and by name.
+
+        :param kind: ``users``, ``channels`` or ``teams``
+        """
+        entity = copy.deepcopy(entity)
+        previous = self._entities[kind].get(entity["id"])
+        self._entities[kind].set(entity["id"], entity)
+        name = _entity_name(kind, entity)
+        if previous is not None and _entity_name(kind, previous) != name:
+            # Renamed, the previous name may be given to another entity
+            self._names[kind].pop(_entity_name(kind, previous))
+        if name:
+            self._names[kind].set(name, entity["id"])
+
+    def replace(self, kind, entity):
+        """
+        Replace the cached version of ``entity`` if there is one.
+
+        :param kind: ``users``, ``channels`` or ``teams``
+        """
+        if self._entities[kind].get(entity["id"]) is not None:
+            self.set(kind, entity)
+
+    def invalidate(self, kind, entity_id=None):
+        """
+        Evict an entity, it is found again by name once it is fetched by id or by name.
+
+        :param kind: ``users``, ``channels`` or ``teams``
+        :param entity_id: The id of the entity, or None to evict all the entities of ``kind``
+        """
+        if entity_id is None:
+            self._entities[kind].clear()
+            self._names[kind].clear()
+        else:
+            self._entities[kind].pop(entity_id)
+
+    def invalidate_endpoint(self, endpoint, me=None):
+        """
+        Evict the entity that may be modified by a request other than GET to ``endpoint``.
+
+        :param me: The id of the user logged in, used for the paths of ``/api/v4/users/me``
+        """
+        match = _ENTITY_WRITE.match(endpoint)
+        if match is None:
+            return
+        kind, entity_id, is_me = match.groups()
+        self._evict(kind, me if is_me else entity_id)
+
+    def handle_event(self, event):
+        """
+        Evict or replace the cached entities modified according to a websocket event,
+        the events other than :data:`ENTITY_EVENTS` are ignored.
+
+        Users are evicted as the ones sent in ``user_updated`` events are sanitized,
+        channels and teams sent in ``channel_updated`` and ``update_team`` events replace the cached ones.
+        Channels and teams are also evicted when their members change, as that may change
+        whether the logged in user can still see them.
+
+        :param event: A decoded websocket event
+        """
+        name = event.get("event")
+        if name not in ENTITY_EVENTS:
+            return
+
+        data = event.get("data") or {}
+        broadcast = event.get("broadcast") or {}
+
+        if name == "user_updated":
+            self._evict("users", (data.get("user") or {}).get("id"))
+        elif name == "user_role_updated":
+            self._evict("users", data.get("user_id"))
+        elif name == "channel_updated":
+            self.replace("channels", self._decode(data["channel"]))
+        elif name == "update_team":
+            self.replace("teams", self._decode(data["team"]))
+        elif name == "delete_team":
+            self._evict("teams", self._decode(data["team"]).get("id"))
+        elif name.startswith(("channel_", "user_")):
+            self._evict("channels", data.get("channel_id") or broadcast.get("channel_id"))
+        else:
+            self._evict("teams", data.get("team_id") or broadcast.get("team_id"))
+
+    def _decode(self, value):
+        # Channels and teams are sent as JSON strings in the event data
+        return self._loads(value) if isinstance(value, (str, bytes)) else value
+
+    def _evict(self, kind, entity_id):
+        if entity_id:
+            self.invalidate(kind, entity_id)
+
+    def evict_all(self):
+        """Evict all the entities, keeping the statistics"""
+        for kind in self.KINDS:
+            self.invalidate(kind)
+
+    def clear(self):
+        """Evict all the entities and reset the statistics"""
+        self.evict_all()
+        with self._lock:
+            self._hits.clear()
+            self._misses.clear()
+
+    def stats(self):
+        """
+        :return: A dict with the number of ``hits``, ``misses`` and entities cached (``size``) by kind
+        """
+        with self._lock:
+            return {
+                kind: {"hits": self._hits[kind], "misses": self._misses[kind], "size": len(self._entities[kind])}
+                for kind in self.KINDS
+            }
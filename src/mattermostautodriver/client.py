@@ -3,24 +3,39 @@ Client for the driver, which holds information about the logged in user
 and actually makes the requests to the mattermost server
 """
 
+import asyncio
+import contextlib
 import logging
+import time
+
 import httpx
 
+from .constants import DOWNLOAD_CHUNK_SIZE
 from .exceptions import (
     InvalidMattermostError,
     InvalidOrMissingParameters,
+    MattermostError,
     NoAccessTokenProvided,
     NotEnoughPermissions,
     ResourceNotFound,
     MethodNotAllowed,
     ContentTooLarge,
+    TooManyRequests,
     FeatureDisabled,
     UnknownMattermostError,
 )
+from .cache import EntityCache, ETagCache
+from .codec import get_codec
+from .instrumentation import HOOKS, StatsCollector, endpoint_template
+from .ratelimit import RateLimiter
+from .singleflight import AsyncSingleFlight, SingleFlight
+from .tracing import ENDPOINT, NOOP_SPAN, NoOpTracer
 
 log = logging.getLogger("mattermostautodriver.websocket")
 log.setLevel(logging.INFO)
 
+JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
 
 class BaseClient:
     def __init__(self, options):
@@ -32,6 +47,7 @@ class BaseClient:
             self.activate_verbose_logging()
 
         self._options = options
+        self.codec = get_codec(options.get("json_backend", "auto"))
         self._token = ""
         self._cookies = None
         self._userid = ""
@@ -40,10 +56,56 @@ class BaseClient:
         if options["proxy"]:
             self._proxy = {"all://": options["proxy"]}
 
+        self._limits = httpx.Limits(
+            max_connections=options.get("max_connections", 100),
+            max_keepalive_connections=options.get("max_keepalive_connections", 20),
+            keepalive_expiry=options.get("keepalive_expiry", 5),
+        )
+        self._timeout = self._make_timeout(options)
+
+        self._rate_limiter = RateLimiter() if options.get("rate_limit", True) else None
+        self._rate_limit_retries = options.get("rate_limit_retries", 3)
+        self._retry_policy = options.get("retry_policy")
+
+        self._etag_cache = None
+        if options.get("etag_cache", False):
+            self._etag_cache = ETagCache(options.get("etag_cache_size", 256))
+
+        self._hooks = {}
+        for event, hooks in (options.get("hooks") or {}).items():
+            for hook in hooks:
+                self.add_hook(event, hook)
+
+        self._tracer = options.get("tracer") or NoOpTracer()
+        self._tracing = getattr(self._tracer, "enabled", True)
+
+        self.stats_collector = None
+        if options.get("collect_stats", False):
+            self.stats_collector = StatsCollector()
+            self.stats_collector.install(self)
+
+        self.entity_cache = None
+        if options.get("entity_cache", False):
+            self.entity_cache = EntityCache(options.get("entity_cache_ttl"), options.get("entity_cache_size", 1000))
+            self.entity_cache.install(self)
+
     @staticmethod
     def _make_url(scheme, url, port):
         return f"{scheme:s}://{url:s}:{port:d}"
 
+    @staticmethod
+    def _make_timeout(options):
+        """
+        :return: The timeouts of the requests, ``request_timeout`` applies to every phase
+            of a request unless a more specific timeout is given
+        """
+        timeouts = {
+            phase: options[f"{phase}_timeout"]
+            for phase in ("connect", "read", "write", "pool")
+            if options.get(f"{phase}_timeout") is not None
+        }
+        return httpx.Timeout(options["request_timeout"], **timeouts)
+
     @staticmethod
     def activate_verbose_logging(level=logging.DEBUG):
         # We register handlers for mattermostautodriver which takes care of
@@ -121,6 +183,9 @@ class BaseClient:
 
     @token.setter
     def token(self, t):
+        if t != self._token and self.entity_cache is not None:
+            # The entities cached for the previous token may not be visible with the new one
+            self.entity_cache.evict_all()
         self._token = t
 
     def auth_header(self):
@@ -130,7 +195,7 @@ class BaseClient:
             return {}
         return {"Authorization": "Bearer {token:s}".format(token=self._token)}
 
-    def _build_request(self, method, options=None, params=None, data=None, files=None):
+    def _build_request(self, method, options=None, params=None, data=None, files=None, content=None, headers=None):
         def filter_dict_or_none(d):
             if not isinstance(d, dict):
                 # this method is only meant to filter dicts, return everything else unchanged
@@ -143,7 +208,10 @@ class BaseClient:
 
             return None
 
-        request_params = {"headers": self.auth_header(), "timeout": self.request_timeout}
+        request_params = {"headers": self.auth_header(), "timeout": self._timeout}
+
+        if headers:
+            request_params["headers"] = {**(request_params["headers"] or {}), **headers}
 
         filtered_params = filter_dict_or_none(params)
         filtered_options = filter_dict_or_none(options)
@@ -155,11 +223,18 @@ class BaseClient:
 
         if method in ("post", "put"):
             if filtered_options is not None:
-                request_params["json"] = filtered_options
+                if filtered_data is None and filtered_files is None and content is None:
+                    request_params["content"] = self.codec.dumps(filtered_options)
+                    request_params["headers"] = {**(request_params["headers"] or {}), **JSON_CONTENT_TYPE}
+                else:
+                    # httpx ignores json= when sending form data, kept for backwards compatibility
+                    request_params["json"] = filtered_options
             if filtered_data is not None:
                 request_params["data"] = filtered_data
             if filtered_files is not None:
                 request_params["files"] = filtered_files
+            if content is not None:
+                request_params["content"] = content
 
         if self._auth is not None:
             request_params["auth"] = self._auth()
@@ -168,6 +243,11 @@ class BaseClient:
 
     @staticmethod
     def _check_response(response):
+        if response.status_code == 304:
+            # Only sent in reply to conditional requests, the caller holds the cached response
+            log.debug(response)
+            return
+
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError as e:
@@ -196,6 +276,8 @@ class BaseClient:
                 raise MethodNotAllowed(message, error_id, request_id, is_oauth_error) from None
             elif e.response.status_code == 413:
                 raise ContentTooLarge(message, error_id, request_id, is_oauth_error) from None
+            elif e.response.status_code == 429:
+                raise TooManyRequests(message, error_id, request_id, is_oauth_error) from None
             elif e.response.status_code == 501:
                 raise FeatureDisabled(message, error_id, request_id, is_oauth_error) from None
             else:
@@ -205,6 +287,197 @@ class BaseClient:
 
         log.debug(response)
 
+    def add_hook(self, event, hook):
+        """
+        Register a function called around every request made with :meth:`make_request`,
+        which includes the requests made by the endpoints, and with ``download``. Hooks are called synchronously,
+        by the async client too, and should return quickly.
+
+        - ``before_request(method, endpoint, request_params)`` before the request is sent
+        - ``after_response(method, endpoint, response, elapsed)`` once the final response is received,
+          whatever its status code
+        - ``on_error(method, endpoint, error, response, elapsed)`` when the request raises an exception,
+          ``response`` is None if no response was received
+
+        ``elapsed`` is the number of seconds since the request was first sent, including retries.
+        For ``download``, ``after_response`` is called once the body is written, with the streamed response.
+
+        :param event: One of ``before_request``, ``after_response`` or ``on_error``
+        :param hook: The function to call
+        """
+        if event not in HOOKS:
+            raise ValueError(f"Unknown hook {event!r}, choose one of: {', '.join(HOOKS)}")
+        self._hooks.setdefault(event, []).append(hook)
+
+    def remove_hook(self, event, hook):
+        """
+        Unregister a function registered with :meth:`add_hook`.
+        """
+        self._hooks.get(event, []).remove(hook)
+
+    def _run_hooks(self, event, *args):
+        for hook in self._hooks.get(event, ()):
+            hook(*args)
+
+    def stats(self):
+        """
+        :return: The statistics collected when the ``collect_stats`` option is enabled,
+            see :meth:`mattermostautodriver.instrumentation.StatsCollector.snapshot`
+        """
+        if self.stats_collector is None:
+            raise RuntimeError("Statistics aren't collected, enable the collect_stats option")
+        return self.stats_collector.snapshot()
+
+    def _request_span(self, method, endpoint):
+        """
+        :return: A span for a request to ``endpoint`` from the configured tracer
+        """
+        if not self._tracing:
+            return NOOP_SPAN
+
+        template = endpoint_template(endpoint)
+        attributes = {
+            "http.request.method": method.upper(),
+            "url.path": endpoint,
+            "url.template": template,
+        }
+        name = ENDPOINT.get()
+        if name is not None:
+            attributes["mattermost.endpoint"] = name
+        return self._tracer.start_span(f"{method.upper()} {template}", attributes)
+
+    @staticmethod
+    def _trace_response(span, response):
+        span.set_attribute("http.response.status_code", response.status_code)
+        request_id = response.headers.get("X-Request-Id")
+        if request_id:
+            span.set_attribute("mattermost.request_id", request_id)
+
+    @staticmethod
+    def _trace_error(span, error):
+        if isinstance(error, MattermostError):
+            span.set_attribute("mattermost.request_id", error.request_id)
+            span.set_attribute("mattermost.error_id", error.error_id)
+
+    def decode_json(self, response):
+        """
+        Decode the JSON body of ``response`` with the configured JSON backend.
+
+        :raises ValueError: If the body isn't valid JSON
+        """
+        return self.codec.loads(response.content)
+
+    def _request_key(self, endpoint, params):
+        """
+        :return: A hashable identifying a GET request to ``endpoint`` with ``params`` made with the current token
+        """
+        query = tuple(sorted((k, str(v)) for k, v in (params or {}).items() if v is not None))
+        return self._token, endpoint, query
+
+    def _etag_lookup(self, endpoint, params):
+        """
+        Find a cached response to make a conditional request for ``endpoint``.
+
+        :return: A tuple with the cache key of the request, the cached ETag and response (or None)
+            and the headers to send with the request
+        """
+        if self._etag_cache is None:
+            return None, None, None
+
+        cache_key = self._request_key(endpoint, params)
+        cached = self._etag_cache.get(cache_key)
+
+        if cached is None:
+            return cache_key, None, None
+
+        return cache_key, cached, {"If-None-Match": cached[0]}
+
+    def _etag_store(self, cache_key, response, result):
+        """
+        Cache the decoded ``result`` of ``response`` if the server sent an ETag with it.
+        """
+        if cache_key is None:
+            return
+
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache.set(cache_key, etag, result)
+
+    def _rate_limit_delay(self):
+        """
+        :return: The number of seconds to wait before sending a request to respect the server rate limits
+        """
+        if self._rate_limiter is None:
+            return 0
+        return self._rate_limiter.reserve()
+
+    def _update_rate_limit(self, response, attempt=None, request_params=None):
+        """
+        Keep track of the rate limits announced in ``response``.
+
+        :param attempt: The number of times the request was already retried, None if it can't be retried
+        :param request_params: The parameters the request was sent with
+        :return: The number of seconds to wait before retrying a rate limited request or None if it
+            shouldn't be retried
+        """
+        if self._rate_limiter is None:
+            return None
+
+        self._rate_limiter.update(response.headers)
+
+        if response.status_code != 429 or attempt is None or attempt >= self._rate_limit_retries:
+            return None
+
+        if not self._can_resend(request_params):
+            return None
+
+        return self._rate_limiter.throttle(response.headers)
+
+    def _retry_delay(self, retries, method, endpoint, options, request_params, response=None, error=None):
+        """
+        Apply the configured retry policy to a failed request.
+
+        :param retries: The number of times the request was already retried
+        :param response: The response received, if any
+        :param error: The exception raised while sending the request, if any
+        :return: The number of seconds to wait before retrying the request or None if it shouldn't be retried
+        """
+        if self._retry_policy is None or not self._can_resend(request_params):
+            return None
+
+        policy = self._retry_policy.for_endpoint(endpoint)
+        if policy is None or not policy.should_retry(retries, method, options, response, error):
+            return None
+
+        return policy.backoff(retries, response)
+
+    @staticmethod
+    def _can_resend(request_params):
+        """
+        :return: False if the request can only be sent once, as uploaded file objects are consumed when sent
+        """
+        return "files" not in request_params
+
+    @staticmethod
+    def _open_destination(destination):
+        """
+        :return: A context manager yielding a binary file object for ``destination``,
+            which is either a path or an already opened file object (left open on exit)
+        """
+        if hasattr(destination, "write"):
+            return contextlib.nullcontext(destination)
+        return open(destination, "wb")
+
+    @staticmethod
+    def _content_length(response):
+        """
+        :return: The size announced by the server for the response body or None if unknown
+        """
+        try:
+            return int(response.headers["Content-Length"])
+        except (KeyError, ValueError):
+            return None
+
     @staticmethod
     def _get_request_method(method, client):
         method = method.lower()
@@ -225,18 +498,91 @@ class Client(BaseClient):
             http2=options.get("http2", False),
             proxy=self._proxy,
             verify=options.get("verify", True),
+            limits=self._limits,
+            timeout=self._timeout,
         )
-
-    def make_request(self, method, endpoint, options=None, params=None, data=None, files=None, basepath=None):
+        self._single_flight = SingleFlight() if options.get("single_flight", False) else None
+
+    def make_request(
+        self,
+        method,
+        endpoint,
+        options=None,
+        params=None,
+        data=None,
+        files=None,
+        basepath=None,
+        content=None,
+        headers=None,
+    ):
         if basepath is not None:
             raise DeprecationWarning(
                 "'basepath' no longer has any effect and will be removed in version 3.x. "
                 "Please remove it from your code."
             )
-        request, url, request_params = self._build_request(method, options, params, data, files)
-        response = request(url + endpoint, **request_params)
+        request, url, request_params = self._build_request(method, options, params, data, files, content, headers)
+        with self._request_span(method, endpoint) as span:
+            self._run_hooks("before_request", method, endpoint, request_params)
+            start = time.perf_counter()
+            response = None
+
+            try:
+                response = self._send(request, url, method, endpoint, options, request_params)
+                if self._tracing:
+                    self._trace_response(span, response)
+                self._run_hooks("after_response", method, endpoint, response, time.perf_counter() - start)
+                self._check_response(response)
+            except Exception as e:
+                if self._tracing:
+                    self._trace_error(span, e)
+                self._run_hooks("on_error", method, endpoint, e, response, time.perf_counter() - start)
+                raise
+
+        return response
+
+    def _send(self, request, url, method, endpoint, options, request_params):
+        """
+        Send a request, retrying it as allowed by the server rate limits and the retry policy.
+
+        :return: The final response
+        """
+        attempt = 0
+        retries = 0
+
+        while True:
+            delay = self._rate_limit_delay()
+            if delay > 0:
+                log.debug(f"Waiting {delay:.2f}s to respect the server rate limits")
+                time.sleep(delay)
+
+            try:
+                response = request(url + endpoint, **request_params)
+            except httpx.TransportError as e:
+                delay = self._retry_delay(retries, method, endpoint, options, request_params, error=e)
+                if delay is None:
+                    raise
+                retries += 1
+                log.warning(f"{type(e).__name__} on {endpoint}, retry {retries} in {delay:.2f}s")
+                time.sleep(delay)
+                continue
+
+            delay = self._update_rate_limit(response, attempt, request_params)
+            if delay is not None:
+                attempt += 1
+                log.warning(f"Rate limited by the server, retrying {endpoint} in {delay:.2f}s")
+                # Only needed for streamed responses, whose body isn't read yet
+                response.close()
+                continue
+
+            delay = self._retry_delay(retries, method, endpoint, options, request_params, response=response)
+            if delay is None:
+                break
+
+            response.close()
+            retries += 1
+            log.warning(f"Status {response.status_code} on {endpoint}, retry {retries} in {delay:.2f}s")
+            time.sleep(delay)
 
-        self._check_response(response)
         return response
 
     def __enter__(self):
@@ -247,26 +593,110 @@ class Client(BaseClient):
         return self.client.__exit__(*exc_info)
 
     def get(self, endpoint, options=None, params=None):
-        response = self.make_request("get", endpoint, options=options, params=params)
+        if self.entity_cache is not None:
+            entity = self.entity_cache.get(endpoint, params)
+            if entity is not None:
+                return entity
+        if self._single_flight is not None:
+            return self._single_flight.do(self._request_key(endpoint, params), self._get, endpoint, options, params)
+        return self._get(endpoint, options, params)
+
+    def _get(self, endpoint, options=None, params=None):
+        cache_key, cached, headers = self._etag_lookup(endpoint, params)
+        response = self.make_request("get", endpoint, options=options, params=params, headers=headers)
+
+        if response.status_code == 304 and cached is not None:
+            log.debug("Response not modified, returning cached response")
+            return cached[1]
 
         if response.headers["Content-Type"] != "application/json":
             log.debug("Response is not application/json, returning raw response")
             return response
 
         try:
-            return response.json()
+            result = self.decode_json(response)
         except ValueError:
             log.debug("Could not convert response to json, returning raw response")
             return response
 
+        self._etag_store(cache_key, response, result)
+        if self.entity_cache is not None:
+            self.entity_cache.store(endpoint, params, result)
+        return result
+
     def post(self, endpoint, options=None, params=None, data=None, files=None):
-        return self.make_request("post", endpoint, options=options, params=params, data=data, files=files).json()
+        return self.decode_json(
+            self.make_request("post", endpoint, options=options, params=params, data=data, files=files)
+        )
 
     def put(self, endpoint, options=None, params=None, data=None):
-        return self.make_request("put", endpoint, options=options, params=params, data=data).json()
+        return self.decode_json(self.make_request("put", endpoint, options=options, params=params, data=data))
 
     def delete(self, endpoint, options=None, params=None, data=None):
-        return self.make_request("delete", endpoint, options=options, params=params, data=data).json()
+        return self.decode_json(self.make_request("delete", endpoint, options=options, params=params, data=data))
+
+    def download(self, endpoint, destination, params=None, chunk_size=DOWNLOAD_CHUNK_SIZE, progress=None):
+        """
+        Stream the body of a GET request to ``destination`` in chunks of ``chunk_size`` bytes
+        instead of keeping the whole response in memory.
+
+        Meant for endpoints returning large files such as ``Files.get_file``, ``Exports.download_export``,
+        ``Jobs.download_job``, ``Compliance.download_compliance_report`` or ``Logs.download_system_logs``.
+
+        .. code:: python
+
+            driver.client.download(f"/api/v4/exports/{export_name}", "/tmp/export.zip")
+
+        :param endpoint: The endpoint to download from, e.g. ``/api/v4/files/{file_id}``
+        :param destination: A path or a binary file object the body is written to
+        :param params: Query parameters of the request
+        :param chunk_size: The size in bytes of the chunks written to ``destination``
+        :param progress: Optional callable called after every chunk with the number of bytes written so far
+            and the total size announced by the server (None if unknown)
+        :return: The number of bytes written to ``destination``
+        """
+        _, url, request_params = self._build_request("get", params=params)
+        written = 0
+
+        with self._request_span("get", endpoint) as span:
+            self._run_hooks("before_request", "get", endpoint, request_params)
+            start = time.perf_counter()
+            response = None
+
+            try:
+                # Retried like the other requests as long as the body isn't read
+                response = self._send(self._stream, url, "get", endpoint, None, request_params)
+                with contextlib.closing(response):
+                    if self._tracing:
+                        self._trace_response(span, response)
+                    if response.is_error:
+                        # Error details are in the body, which isn't loaded yet in streaming mode
+                        response.read()
+                    else:
+                        total = self._content_length(response)
+                        with self._open_destination(destination) as fh:
+                            for chunk in response.iter_bytes(chunk_size):
+                                fh.write(chunk)
+                                written += len(chunk)
+                                if progress is not None:
+                                    progress(written, total)
+
+                # Called once the body is written, so the latency covers the whole download
+                self._run_hooks("after_response", "get", endpoint, response, time.perf_counter() - start)
+                self._check_response(response)
+            except Exception as e:
+                if self._tracing:
+                    self._trace_error(span, e)
+                self._run_hooks("on_error", "get", endpoint, e, response, time.perf_counter() - start)
+                raise
+
+        return written
+
+    def _stream(self, url, auth=httpx.USE_CLIENT_DEFAULT, **request_params):
+        """
+        :return: The response to a GET request to ``url`` with its body not read yet, to be closed by the caller
+        """
+        return self.client.send(self.client.build_request("GET", url, **request_params), auth=auth, stream=True)
 
     def call_webhook(self, hook_id, options=None):
         return self.make_request("post", "/hooks/" + hook_id, options=options)
@@ -282,7 +712,10 @@ class AsyncClient(BaseClient):
             http2=options.get("http2", False),
             proxy=self._proxy,
             verify=options.get("verify", True),
+            limits=self._limits,
+            timeout=self._timeout,
         )
+        self._single_flight = AsyncSingleFlight() if options.get("single_flight", False) else None
 
     async def __aenter__(self):
         await self.client.__aenter__()
@@ -291,46 +724,194 @@ class AsyncClient(BaseClient):
     async def __aexit__(self, *exc_info):
         return await self.client.__aexit__(*exc_info)
 
-    async def make_request(self, method, endpoint, options=None, params=None, data=None, files=None, basepath=None):
+    async def make_request(
+        self,
+        method,
+        endpoint,
+        options=None,
+        params=None,
+        data=None,
+        files=None,
+        basepath=None,
+        content=None,
+        headers=None,
+    ):
         if basepath is not None:
             raise DeprecationWarning(
                 "'basepath' no longer has any effect and will be removed in version 3.x. "
                 "Please remove it from your code."
             )
-        request, url, request_params = self._build_request(method, options, params, data, files)
-        response = await request(url + endpoint, **request_params)
+        request, url, request_params = self._build_request(method, options, params, data, files, content, headers)
+        with self._request_span(method, endpoint) as span:
+            self._run_hooks("before_request", method, endpoint, request_params)
+            start = time.perf_counter()
+            response = None
+
+            try:
+                response = await self._send(request, url, method, endpoint, options, request_params)
+                if self._tracing:
+                    self._trace_response(span, response)
+                self._run_hooks("after_response", method, endpoint, response, time.perf_counter() - start)
+                self._check_response(response)
+            except Exception as e:
+                if self._tracing:
+                    self._trace_error(span, e)
+                self._run_hooks("on_error", method, endpoint, e, response, time.perf_counter() - start)
+                raise
+
+        return response
+
+    async def _send(self, request, url, method, endpoint, options, request_params):
+        """
+        Send a request, retrying it as allowed by the server rate limits and the retry policy.
+
+        :return: The final response
+        """
+        attempt = 0
+        retries = 0
+
+        while True:
+            delay = self._rate_limit_delay()
+            if delay > 0:
+                log.debug(f"Waiting {delay:.2f}s to respect the server rate limits")
+                await asyncio.sleep(delay)
+
+            try:
+                response = await request(url + endpoint, **request_params)
+            except httpx.TransportError as e:
+                delay = self._retry_delay(retries, method, endpoint, options, request_params, error=e)
+                if delay is None:
+                    raise
+                retries += 1
+                log.warning(f"{type(e).__name__} on {endpoint}, retry {retries} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            delay = self._update_rate_limit(response, attempt, request_params)
+            if delay is not None:
+                attempt += 1
+                log.warning(f"Rate limited by the server, retrying {endpoint} in {delay:.2f}s")
+                # Only needed for streamed responses, whose body isn't read yet
+                await response.aclose()
+                continue
+
+            delay = self._retry_delay(retries, method, endpoint, options, request_params, response=response)
+            if delay is None:
+                break
+
+            await response.aclose()
+            retries += 1
+            log.warning(f"Status {response.status_code} on {endpoint}, retry {retries} in {delay:.2f}s")
+            await asyncio.sleep(delay)
 
-        self._check_response(response)
         return response
 
     async def get(self, endpoint, options=None, params=None):
-        response = await self.make_request("get", endpoint, options=options, params=params)
+        if self.entity_cache is not None:
+            entity = self.entity_cache.get(endpoint, params)
+            if entity is not None:
+                return entity
+        if self._single_flight is not None:
+            return await self._single_flight.do(
+                self._request_key(endpoint, params), self._get, endpoint, options, params
+            )
+        return await self._get(endpoint, options, params)
+
+    async def _get(self, endpoint, options=None, params=None):
+        cache_key, cached, headers = self._etag_lookup(endpoint, params)
+        response = await self.make_request("get", endpoint, options=options, params=params, headers=headers)
+
+        if response.status_code == 304 and cached is not None:
+            log.debug("Response not modified, returning cached response")
+            return cached[1]
 
         if response.headers["Content-Type"] != "application/json":
             log.debug("Response is not application/json, returning raw response")
             return response
 
         try:
-            return response.json()
+            result = self.decode_json(response)
         except ValueError:
             log.debug("Could not convert response to json, returning raw response")
             return response
 
+        self._etag_store(cache_key, response, result)
+        if self.entity_cache is not None:
+            self.entity_cache.store(endpoint, params, result)
+        return result
+
     async def post(self, endpoint, options=None, params=None, data=None, files=None):
         response = await self.make_request("post", endpoint, options=options, params=params, data=data, files=files)
-        return response.json()
+        return self.decode_json(response)
 
     async def put(self, endpoint, options=None, params=None, data=None):
         response = await self.make_request("put", endpoint, options=options, params=params, data=data)
-        return response.json()
+        return self.decode_json(response)
 
     async def delete(self, endpoint, options=None, params=None, data=None):
         response = await self.make_request("delete", endpoint, options=options, params=params, data=data)
-        return response.json()
+        return self.decode_json(response)
+
+    async def download(self, endpoint, destination, params=None, chunk_size=DOWNLOAD_CHUNK_SIZE, progress=None):
+        """
+        Asynchronous version of :meth:`Client.download`.
+
+        Note that writing to ``destination`` is done synchronously.
+
+        :param endpoint: The endpoint to download from, e.g. ``/api/v4/files/{file_id}``
+        :param destination: A path or a binary file object the body is written to
+        :param params: Query parameters of the request
+        :param chunk_size: The size in bytes of the chunks written to ``destination``
+        :param progress: Optional callable called after every chunk with the number of bytes written so far
+            and the total size announced by the server (None if unknown)
+        :return: The number of bytes written to ``destination``
+        """
+        _, url, request_params = self._build_request("get", params=params)
+        written = 0
+
+        with self._request_span("get", endpoint) as span:
+            self._run_hooks("before_request", "get", endpoint, request_params)
+            start = time.perf_counter()
+            response = None
+
+            try:
+                # Retried like the other requests as long as the body isn't read
+                response = await self._send(self._stream, url, "get", endpoint, None, request_params)
+                async with contextlib.aclosing(response):
+                    if self._tracing:
+                        self._trace_response(span, response)
+                    if response.is_error:
+                        # Error details are in the body, which isn't loaded yet in streaming mode
+                        await response.aread()
+                    else:
+                        total = self._content_length(response)
+                        with self._open_destination(destination) as fh:
+                            async for chunk in response.aiter_bytes(chunk_size):
+                                fh.write(chunk)
+                                written += len(chunk)
+                                if progress is not None:
+                                    progress(written, total)
+
+                # Called once the body is written, so the latency covers the whole download
+                self._run_hooks("after_response", "get", endpoint, response, time.perf_counter() - start)
+                self._check_response(response)
+            except Exception as e:
+                if self._tracing:
+                    self._trace_error(span, e)
+                self._run_hooks("on_error", "get", endpoint, e, response, time.perf_counter() - start)
+                raise
+
+        return written
+
+    async def _stream(self, url, auth=httpx.USE_CLIENT_DEFAULT, **request_params):
+        """
+        :return: The response to a GET request to ``url`` with its body not read yet, to be closed by the caller
+        """
+        return await self.client.send(self.client.build_request("GET", url, **request_params), auth=auth, stream=True)
 
     async def call_webhook(self, hook_id, options=None):
         response = await self.make_request("post", "/hooks/" + hook_id, options=options)
-        return response.json()
+        return self.decode_json(response)
 
     async def close(self):
         await self.client.aclose()
@@ -0,0 +1,102 @@
+"""
+JSON encoders and decoders used for request and response bodies and websocket messages
+"""
+
+import functools
+import json
+
+
+class StdlibCodec:
+    """JSON codec based on the ``json`` module of the standard library"""
+
+    name = "json"
+
+    @staticmethod
+    def dumps(obj):
+        # Same output as httpx when sending a body with json=
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    @staticmethod
+    def loads(data):
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """JSON codec based on `orjson <https://github.com/ijl/orjson>`_"""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        # Dict keys that aren't strings are converted like the json module does instead of raising TypeError.
+        # Unlike the json module, NaN and infinity are encoded as null instead of raising ValueError.
+        self.dumps = functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+        # orjson.JSONDecodeError is a subclass of ValueError
+        self.loads = orjson.loads
+
+
+class MsgspecCodec:
+    """JSON codec based on `msgspec <https://github.com/jcrist/msgspec>`_"""
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._decode_error = msgspec.DecodeError
+        # Unlike the json module, NaN and infinity are encoded as null instead of raising ValueError
+        self.dumps = msgspec.json.Encoder().encode
+        self._decode = msgspec.json.Decoder().decode
+
+    def loads(self, data):
+        try:
+            return self._decode(data)
+        except self._decode_error as e:
+            # Callers expect a ValueError for invalid documents, as raised by the other codecs
+            raise ValueError(str(e)) from e
+
+
+class AutoCodec:
+    """
+    JSON codec decoding with the fastest codec installed and encoding with :class:`StdlibCodec`,
+    so request bodies are encoded the same way, and the same ones are rejected, whatever is installed
+    """
+
+    def __init__(self):
+        for codec_cls in CODECS.values():
+            try:
+                decoder = codec_cls()
+            except ImportError:
+                continue
+            break
+        self.name = decoder.name
+        self.dumps = StdlibCodec.dumps
+        self.loads = decoder.loads
+
+
+CODECS = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": StdlibCodec,
+}
+
+
+def get_codec(backend="auto"):
+    """
+    :param backend: The name of a codec in :data:`CODECS`, ``auto`` to decode with the fastest one installed
+        (see :class:`AutoCodec`), or an object with ``dumps`` (returning bytes) and ``loads`` methods
+    :return: The JSON codec for ``backend``
+    """
+    if not isinstance(backend, str):
+        return backend
+
+    if backend == "auto":
+        return AutoCodec()
+
+    try:
+        codec_cls = CODECS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown JSON backend {backend!r}, choose one of: auto, {', '.join(CODECS)}") from None
+
+    return codec_cls()
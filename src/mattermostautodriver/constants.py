@@ -3,3 +3,27 @@ MAX_PER_PAGE = 200
 
 #: Default number of items per page used by the Mattermost API when ``per_page`` is omitted.
 DEFAULT_PER_PAGE = 60
+
+#: Size in bytes of the chunks written to disk by ``Client.download`` and ``AsyncClient.download``.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+#: Size in bytes of the chunks sent by ``Uploader`` and ``AsyncUploader`` on each request.
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+#: Default number of requests run at once by ``AsyncTypedDriver.gather``.
+DEFAULT_CONCURRENCY = 10
+
+#: Maximum number of ids sent in one request by the batch loaders.
+MAX_BATCH_SIZE = 200
+
+#: Seconds during which a user status is reused by ``StatusLoader`` and ``AsyncStatusLoader``.
+STATUS_TTL = 1
+
+#: Default seconds during which entities are reused by ``EntityCache``, by kind.
+ENTITY_CACHE_TTL = {"users": 300, "channels": 300, "teams": 900}
+
+#: Websocket events dropped first when the event queue is full with the ``drop_by_type`` overflow policy.
+DROPPABLE_EVENTS = ("typing", "status_change")
+
+#: Regular expression matching a Mattermost id, 26 lowercase alphanumeric characters.
+ID_PATTERN = r"[a-z0-9]{26}"
@@ -1,7 +1,10 @@
 import logging
 import warnings
 
+from ..cache import ENTITY_EVENTS
 from ..client import Client
+from ..constants import DROPPABLE_EVENTS
+from ..events import EventRouter
 
 log = logging.getLogger("mattermostautodriver.api")
 log.setLevel(logging.INFO)
@@ -28,9 +31,33 @@ class BaseDriver:
         "keepalive": False,
         "keepalive_delay": 5,
         "websocket_kw_args": None,
+        "websocket_workers": 0,
+        "websocket_queue_size": 1000,
+        "websocket_overflow": "block",
+        "websocket_droppable_events": DROPPABLE_EVENTS,
         "debug": False,
         "http2": False,
         "proxy": None,
+        "rate_limit": True,
+        "rate_limit_retries": 3,
+        "retry_policy": None,
+        "max_connections": 100,
+        "max_keepalive_connections": 20,
+        "keepalive_expiry": 5,
+        "connect_timeout": None,
+        "read_timeout": None,
+        "write_timeout": None,
+        "pool_timeout": None,
+        "etag_cache": False,
+        "etag_cache_size": 256,
+        "json_backend": "auto",
+        "single_flight": False,
+        "hooks": None,
+        "collect_stats": False,
+        "tracer": None,
+        "entity_cache": False,
+        "entity_cache_ttl": None,
+        "entity_cache_size": 1000,
     }
     """
     Required options
@@ -52,6 +79,39 @@ class BaseDriver:
         - mfa_token (None)
         - auth (None)
         - debug (False)
+        - rate_limit (True) - pace requests according to the rate limits announced by the server
+        - rate_limit_retries (3) - times a request refused with 429 Too Many Requests is retried
+        - retry_policy (None) - a :class:`~mattermostautodriver.retry.RetryPolicy` retrying requests
+          failing with transient errors
+        - max_connections (100) - maximum number of concurrent connections to the server
+        - max_keepalive_connections (20) - maximum number of idle connections kept open
+        - keepalive_expiry (5) - seconds an idle connection is kept open
+        - connect_timeout, read_timeout, write_timeout, pool_timeout (None) - timeouts of each phase
+          of a request, overriding request_timeout
+        - etag_cache (False) - send ``If-None-Match`` with GET requests and reuse the cached response
+          when the server replies ``304 Not Modified``. Cached responses are shared and must not be modified.
+        - etag_cache_size (256) - maximum number of responses kept by the ETag cache
+        - json_backend ('auto') - library used to encode and decode JSON: 'orjson', 'msgspec' or 'json'.
+          'auto' decodes with the first one installed in this order and encodes with 'json'.
+        - single_flight (False) - share one request and its decoded response between identical GET requests
+          made while the first one is in flight. Shared responses must not be modified.
+        - hooks (None) - dict of the functions called around every request by hook name
+          (``before_request``, ``after_response`` or ``on_error``), see ``Client.add_hook``
+        - collect_stats (False) - collect request counts, errors, bytes and latency histograms per endpoint,
+          read with ``driver.client.stats()``
+        - tracer (None) - tracer creating spans around requests and websocket event dispatch,
+          see ``mattermostautodriver.tracing``
+        - entity_cache (False) - reuse the users, channels and teams fetched by id or name,
+          see ``mattermostautodriver.cache.EntityCache``
+        - entity_cache_ttl (None) - seconds after which cached entities expire, one number for every kind
+          or a dict by kind (``users``, ``channels`` and ``teams``), defaults to ``ENTITY_CACHE_TTL``
+        - entity_cache_size (1000) - maximum number of entities of each kind kept by the entity cache
+        - websocket_workers (0) - number of tasks passing the websocket events to the event handler
+          through a queue, so a slow handler doesn't stall receiving events. 0 calls the handler inline.
+        - websocket_queue_size (1000) - maximum number of websocket events waiting for a worker
+        - websocket_overflow ('block') - what to do with events received when the queue is full:
+          'block', 'drop_oldest' or 'drop_by_type', see ``mattermostautodriver.websocket.EventQueue``
+        - websocket_droppable_events (``DROPPABLE_EVENTS``) - event types dropped first with 'drop_by_type'
     """
 
     def __init__(self, options=None, client_cls=Client, *args, **kwargs):
@@ -71,6 +131,22 @@ class BaseDriver:
         self.client = client_cls(self.options)
         self.websocket = None
 
+    def _websocket_event_handler(self, event_handler):
+        """
+        :return: The event handler given to the websocket, updating the entity cache, if enabled,
+            with the events modifying users, channels and teams before calling ``event_handler``
+        """
+        cache = self.client.entity_cache
+        if cache is None:
+            return event_handler
+
+        # A router of its own rather than the one given, which may be shared with other drivers.
+        # It decodes the events the cache needs separately, so handlers modifying them don't change the cache
+        router = EventRouter(self.client.codec, default=event_handler)
+        for event in ENTITY_EVENTS:
+            router.add_handler(event, cache.handle_event)
+        return router
+
     def disconnect(self):
         """Disconnects the driver from the server, stopping the websocket event loop."""
         if self.websocket is not None:
@@ -1,8 +1,11 @@
 import asyncio
+import functools
 import logging
 import warnings
 
+from ..bulk import async_gather, gather
 from ..client import AsyncClient, Client
+from ..constants import DEFAULT_CONCURRENCY
 from ..websocket import Websocket
 
 from .endpoint_base import BaseDriverWithEndpoints, TypedBaseDriverWithEndpoints
@@ -52,13 +55,17 @@ class Driver(BaseDriverWithEndpoints):
                         print(message)
 
 
+        Use a ``mattermostautodriver.events.EventRouter`` as ``event_handler`` to call
+        different handlers by event type. When the ``entity_cache`` option is enabled, the cached users,
+        channels and teams are updated with the events before they are passed to ``event_handler``.
+
         :param event_handler: The function to handle the websocket events. Takes one argument.
         :type event_handler: Function(message)
         :return: The event loop
         """
         self.websocket = websocket_cls(self.options, self.client.token)
         loop = asyncio.get_event_loop()
-        loop.run_until_complete(self.websocket.connect(event_handler))
+        loop.run_until_complete(self.websocket.connect(self._websocket_event_handler(event_handler)))
         return loop
 
     def login(self):
@@ -91,7 +98,7 @@ class Driver(BaseDriverWithEndpoints):
                 self.client.token = response.headers["Token"]
                 self.client.cookies = response.cookies
             try:
-                result = response.json()
+                result = self.client.decode_json(response)
             except ValueError:
                 log.debug("Could not convert response to json, returning raw response")
                 result = response
@@ -151,13 +158,17 @@ class TypedDriver(TypedBaseDriverWithEndpoints):
                         print(message)
 
 
+        Use a ``mattermostautodriver.events.EventRouter`` as ``event_handler`` to call
+        different handlers by event type. When the ``entity_cache`` option is enabled, the cached users,
+        channels and teams are updated with the events before they are passed to ``event_handler``.
+
         :param event_handler: The function to handle the websocket events. Takes one argument.
         :type event_handler: Function(message)
         :return: The event loop
         """
         self.websocket = websocket_cls(self.options, self.client.token)
         loop = asyncio.get_event_loop()
-        loop.run_until_complete(self.websocket.connect(event_handler))
+        loop.run_until_complete(self.websocket.connect(self._websocket_event_handler(event_handler)))
         return loop
 
     def login(self):
@@ -190,7 +201,7 @@ class TypedDriver(TypedBaseDriverWithEndpoints):
                 self.client.token = response.headers["Token"]
                 self.client.cookies = response.cookies
             try:
-                result = response.json()
+                result = self.client.decode_json(response)
             except ValueError:
                 log.debug("Could not convert response to json, returning raw response")
                 result = response
@@ -217,6 +228,41 @@ class TypedDriver(TypedBaseDriverWithEndpoints):
         self.client.cookies = None
         return result
 
+    def gather(self, calls, concurrency=DEFAULT_CONCURRENCY, return_exceptions=True):
+        """
+        Run many endpoint calls in a pool of threads sharing the connection pool of the client,
+        with at most ``concurrency`` requests in flight at once. Failures don't stop the other calls.
+
+        .. code:: python
+
+            from functools import partial
+
+            users = driver.gather([partial(driver.users.get_user, user_id) for user_id in user_ids], concurrency=20)
+            failed = [user for user in users if isinstance(user, Exception)]
+
+        See :func:`mattermostautodriver.bulk.gather`.
+
+        :param calls: Callables taking no argument
+        :param concurrency: The maximum number of requests in flight at once
+        :param return_exceptions: Return exceptions in place of results instead of raising ``BulkError``
+        :return: A list with the result or the exception raised by each call, in the order of ``calls``
+        """
+        return gather(calls, concurrency, return_exceptions)
+
+    def map(self, func, *iterables, concurrency=DEFAULT_CONCURRENCY, return_exceptions=True):
+        """
+        Call the endpoint ``func`` with arguments taken from each of the ``iterables``, like the ``map`` builtin,
+        in a pool of ``concurrency`` threads.
+
+        .. code:: python
+
+            users = driver.map(driver.users.get_user, user_ids, concurrency=20)
+
+        :return: A list with the result or the exception raised by each call, in the order of the arguments
+        """
+        calls = [functools.partial(func, *args) for args in zip(*iterables)]
+        return gather(calls, concurrency, return_exceptions)
+
     def close(self):
         self.client.close()
 
@@ -264,12 +310,16 @@ class AsyncDriver(BaseDriverWithEndpoints):
                         print(message)
 
 
+        Use a ``mattermostautodriver.events.EventRouter`` as ``event_handler`` to call
+        different handlers by event type. When the ``entity_cache`` option is enabled, the cached users,
+        channels and teams are updated with the events before they are passed to ``event_handler``.
+
         :param event_handler: The function to handle the websocket events. Takes one argument.
         :type event_handler: Function(message)
         :return: coroutine
         """
         self.websocket = websocket_cls(self.options, self.client.token)
-        return self.websocket.connect(event_handler)
+        return self.websocket.connect(self._websocket_event_handler(event_handler))
 
     async def login(self):
         """
@@ -301,7 +351,7 @@ class AsyncDriver(BaseDriverWithEndpoints):
                 self.client.token = response.headers["Token"]
                 self.client.cookies = response.cookies
             try:
-                result = response.json()
+                result = self.client.decode_json(response)
             except ValueError:
                 log.debug("Could not convert response to json, returning raw response")
                 result = response
@@ -364,12 +414,16 @@ class AsyncTypedDriver(TypedBaseDriverWithEndpoints):
                         print(message)
 
 
+        Use a ``mattermostautodriver.events.EventRouter`` as ``event_handler`` to call
+        different handlers by event type. When the ``entity_cache`` option is enabled, the cached users,
+        channels and teams are updated with the events before they are passed to ``event_handler``.
+
         :param event_handler: The function to handle the websocket events. Takes one argument.
         :type event_handler: Function(message)
         :return: coroutine
         """
         self.websocket = websocket_cls(self.options, self.client.token)
-        return self.websocket.connect(event_handler)
+        return self.websocket.connect(self._websocket_event_handler(event_handler))
 
     async def login(self):
         """
@@ -401,7 +455,7 @@ class AsyncTypedDriver(TypedBaseDriverWithEndpoints):
                 self.client.token = response.headers["Token"]
                 self.client.cookies = response.cookies
             try:
-                result = response.json()
+                result = self.client.decode_json(response)
             except ValueError:
                 log.debug("Could not convert response to json, returning raw response")
                 result = response
@@ -428,5 +482,24 @@ class AsyncTypedDriver(TypedBaseDriverWithEndpoints):
         self.client.cookies = None
         return result
 
+    async def gather(self, calls, concurrency=DEFAULT_CONCURRENCY, return_exceptions=True):
+        """
+        Run many endpoint calls on the connection pool of the client, with at most
+        ``concurrency`` requests in flight at once. Failures don't cancel the other calls.
+
+        .. code:: python
+
+            users = await driver.gather((driver.users.get_user(user_id) for user_id in user_ids), concurrency=20)
+            failed = [user for user in users if isinstance(user, Exception)]
+
+        See :func:`mattermostautodriver.bulk.async_gather`.
+
+        :param calls: Coroutines returned by the endpoints or callables taking no argument and returning one
+        :param concurrency: The maximum number of requests in flight at once
+        :param return_exceptions: Return exceptions in place of results instead of raising ``BulkError``
+        :return: A list with the result or the exception raised by each call, in the order of ``calls``
+        """
+        return await async_gather(calls, concurrency, return_exceptions)
+
     async def close(self):
         await self.client.close()
@@ -0,0 +1,50 @@
+import importlib
+
+
+class LazyEndpoint:
+    """
+    Class attribute of a driver giving an instance of an endpoint class bound to the client of the driver.
+
+    The module of the endpoint class is only imported and the instance created on first access,
+    after which the instance is stored on the driver and returned directly, so drivers don't pay
+    for the ~70 endpoint modules they don't use.
+    """
+
+    def __init__(self, module, class_name, legacy=False):
+        """
+        :param module: The absolute name of the module defining the endpoint class
+        :param class_name: The name of the endpoint class
+        :param legacy: Give the legacy version of the endpoint class taking payload dicts,
+            see :mod:`mattermostautodriver.endpoints_old`
+        """
+        self.module = module
+        self.class_name = class_name
+        self.legacy = legacy
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def load(self):
+        """
+        :return: The endpoint class, imported if needed
+        """
+        endpoint_class = getattr(importlib.import_module(self.module), self.class_name)
+        if self.legacy:
+            from ..endpoints_old import legacy_endpoint
+
+            endpoint_class = legacy_endpoint(endpoint_class)
+        return endpoint_class
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        endpoint_class = self.load()
+        if instance.client._tracing:
+            from ..tracing import traced_endpoint
+
+            endpoint_class = traced_endpoint(endpoint_class)
+        endpoint = endpoint_class(instance.client)
+        # This descriptor doesn't define __set__, so the instance attribute takes precedence from now on
+        instance.__dict__[self.name] = endpoint
+        return endpoint
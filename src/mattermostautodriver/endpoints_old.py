@@ -0,0 +1,107 @@
+"""
+Endpoints of the legacy ``Driver`` and ``AsyncDriver`` API, taking the request payload as dicts
+(``options``, ``params``, ``data`` and ``files``) instead of one argument per field.
+
+They aren't generated: each legacy class is built on first use from the typed class of the same name in
+:mod:`mattermostautodriver.endpoints`, so both APIs share one set of generated modules. The HTTP method
+and URL of every endpoint method are found by calling the typed method with a client that records
+the request instead of sending it, and the legacy method forwards its dicts to the real client.
+
+.. code:: python
+
+    from mattermostautodriver.endpoints.users import Users
+    from mattermostautodriver.endpoints_old import legacy_endpoint
+
+    users = legacy_endpoint(Users)(driver.client)
+    users.get_users(params={"per_page": 200})
+"""
+
+import functools
+import inspect
+
+from .endpoints._base import Base
+
+
+def _recorder(method):
+    def record(endpoint, **kwargs):
+        return method, endpoint, kwargs
+
+    return staticmethod(record)
+
+
+class _RecordingClient:
+    """Client returning the request an endpoint method makes instead of sending it"""
+
+    get = _recorder("get")
+    post = _recorder("post")
+    put = _recorder("put")
+    patch = _recorder("patch")
+    delete = _recorder("delete")
+
+
+def _legacy_payload(kwargs):
+    """
+    :param kwargs: The keyword arguments passed to the client by a typed endpoint method
+    :return: The names of the payload arguments of the legacy method, in order
+    """
+    if "files" in kwargs:
+        # multipart/form-data with a file
+        return ["files", "data"]
+    if "data" in kwargs:
+        # x-www-form-urlencoded bodies are given as is to the typed method, multipart/form-data fields as a dict
+        if kwargs["data"] == "{data}":
+            return ["files", "options"]
+        return ["data"]
+    if "options" in kwargs:
+        return ["options"]
+    if "params" in kwargs:
+        return ["params"]
+    return []
+
+
+def _legacy_method_source(name, function):
+    """
+    :return: The source code of the legacy version of the typed endpoint method ``function``
+    """
+    parameters = list(inspect.signature(function).parameters)[1:]
+    # Pass every argument as a placeholder, so the recorded URL is the template of the endpoint path
+    method, url, kwargs = function(Base(_RecordingClient()), *(f"{{{parameter}}}" for parameter in parameters))
+    path = [parameter for parameter in parameters if f"{{{parameter}}}" in url]
+    payload = _legacy_payload(kwargs)
+    arguments = ", ".join(["self", *path, *(f"{argument}=None" for argument in payload)])
+    url = f"f{url!r}" if path else repr(url)
+    forwarded = "".join(f", {argument}={argument}" for argument in payload)
+    return f"def {name}({arguments}):\n    return self.client.{method}({url}{forwarded})\n"
+
+
+@functools.cache
+def legacy_endpoint(endpoint_class):
+    """
+    Build the legacy version of a typed endpoint class.
+
+    :param endpoint_class: An endpoint class of :mod:`mattermostautodriver.endpoints`, e.g. ``Users``
+    :return: A class with the same name and methods, taking their path arguments and payload dicts
+        the way the legacy endpoints did
+    """
+    attributes = {"__module__": __name__, "__doc__": endpoint_class.__doc__}
+    sources = []
+    for name, function in vars(endpoint_class).items():
+        if name.startswith("_") or not inspect.isfunction(function):
+            continue
+        try:
+            sources.append(_legacy_method_source(name, function))
+        except NameError:
+            # A few endpoints use path arguments missing from the API specification and always fail,
+            # keep them as they are so they fail the same way
+            attributes[name] = function
+
+    namespace = {}
+    exec(compile("\n".join(sources), f"<legacy {endpoint_class.__name__}>", "exec"), namespace)
+    for name, legacy_method in namespace.items():
+        if name == "__builtins__":
+            continue
+        legacy_method.__doc__ = getattr(endpoint_class, name).__doc__
+        legacy_method.__qualname__ = f"{endpoint_class.__name__}.{name}"
+        legacy_method.__module__ = __name__
+        attributes[name] = legacy_method
+    return type(endpoint_class.__name__, (Base,), attributes)
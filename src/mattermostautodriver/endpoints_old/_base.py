@@ -1,3 +0,0 @@
-class Base:
-    def __init__(self, client):
-        self.client = client
@@ -0,0 +1,142 @@
+"""
+Dispatch of websocket events to handlers registered by event type
+"""
+
+import inspect
+import logging
+
+from .codec import get_codec
+from .websocket import peek_event
+
+log = logging.getLogger("mattermostautodriver.websocket")
+
+#: Event type of the handlers called for every event
+ALL_EVENTS = "*"
+
+#: Fields of the event data sent as JSON strings by the server, decoded by :class:`EventRouter`
+JSON_FIELDS = {
+    "posted": ("post",),
+    "post_edited": ("post",),
+    "post_deleted": ("post",),
+    "ephemeral_message": ("post",),
+    "channel_updated": ("channel",),
+    "channel_member_updated": ("channelMember",),
+    "update_team": ("team",),
+    "delete_team": ("team",),
+    "emoji_added": ("emoji",),
+    "reaction_added": ("reaction",),
+    "reaction_removed": ("reaction",),
+    "preference_changed": ("preference",),
+    "preferences_changed": ("preferences",),
+    "preferences_deleted": ("preferences",),
+    "thread_updated": ("thread",),
+}
+
+
+class EventRouter:
+    """
+    Event handler for ``init_websocket`` calling the handlers registered for the type of each event.
+
+    Every message is decoded once and the handlers are given the decoded event, with the fields of
+    :data:`JSON_FIELDS` decoded as well (e.g. ``event["data"]["post"]`` is a dict for ``posted`` events).
+    The type of the event is read from the raw message first, so the messages of event types
+    without handlers (e.g. ``typing``) are never decoded.
+
+    Handlers may be functions or coroutine functions. An exception raised by a handler is logged
+    and doesn't prevent the other handlers from running.
+
+    .. code:: python
+
+        from mattermostautodriver.events import EventRouter
+
+        router = EventRouter()
+
+        @router.on("posted")
+        async def handle_posted(event):
+            print(event["data"]["post"]["message"])
+
+        await driver.init_websocket(router)
+    """
+
+    def __init__(self, codec=None, default=None):
+        """
+        :param codec: The JSON codec used to decode the messages, see :mod:`mattermostautodriver.codec`,
+            by default the fastest one installed
+        :param default: Optional event handler called with every raw message after the handlers of its event,
+            e.g. an event handler written for ``init_websocket``
+        """
+        self.codec = codec if codec is not None else get_codec("auto")
+        self.default = default
+        self._handlers = {}
+
+    def on(self, *events):
+        """
+        Decorator registering a handler for the given event types, or every event with ``"*"``.
+
+        :param events: The event types, e.g. ``posted``
+        """
+
+        def decorator(handler):
+            for event in events:
+                self.add_handler(event, handler)
+            return handler
+
+        return decorator
+
+    def add_handler(self, event, handler, first=False):
+        """
+        Register ``handler`` for the events of type ``event``, registering it twice has no effect.
+
+        :param event: The event type, e.g. ``posted``, or ``"*"`` for every event
+        :param handler: Function or coroutine function taking the decoded event
+        :param first: Call the handler before the ones already registered
+        """
+        handlers = self._handlers.setdefault(event, [])
+        if handler in handlers:
+            return
+        if first:
+            handlers.insert(0, handler)
+        else:
+            handlers.append(handler)
+
+    def remove_handler(self, event, handler):
+        """
+        Unregister a handler added for ``event``.
+
+        :raises ValueError: If the handler isn't registered for ``event``
+        """
+        self._handlers.get(event, []).remove(handler)
+
+    def handlers(self, event):
+        """
+        :return: The handlers called for the events of type ``event``, in order
+        """
+        return self._handlers.get(event, []) + self._handlers.get(ALL_EVENTS, [])
+
+    def decode(self, message):
+        """
+        :return: The event of ``message`` with the fields of :data:`JSON_FIELDS` decoded
+        """
+        event = self.codec.loads(message)
+        fields = JSON_FIELDS.get(event.get("event"))
+        if fields:
+            data = event.get("data") or {}
+            for field in fields:
+                if isinstance(data.get(field), str):
+                    data[field] = self.codec.loads(data[field])
+        return event
+
+    async def __call__(self, message):
+        handlers = self.handlers(peek_event(message))
+        if handlers:
+            event = self.decode(message)
+            for handler in handlers:
+                try:
+                    result = handler(event)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception:
+                    log.exception(f"Handler {handler!r} failed on {event.get('event')} event")
+
+        if self.default is not None:
+            await self.default(message)
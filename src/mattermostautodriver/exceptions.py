@@ -133,6 +133,24 @@ class ContentTooLarge(MattermostError):
         )
 
 
+class TooManyRequests(UnknownMattermostError):
+    """
+    Raised when mattermost returns a
+    429 Too many requests
+
+    Subclass of :class:`UnknownMattermostError`, which was raised for 429 before
+    """
+
+    def __init__(self, message: str, error_id: str, request_id: str, is_oauth_error: bool):
+        super().__init__(
+            message=message,
+            status_code=429,
+            error_id=error_id,
+            request_id=request_id,
+            is_oauth_error=is_oauth_error,
+        )
+
+
 class FeatureDisabled(MattermostError):
     """
     Raised when mattermost returns a
@@ -147,3 +165,17 @@ class FeatureDisabled(MattermostError):
             request_id=request_id,
             is_oauth_error=is_oauth_error,
         )
+
+
+class BulkError(Exception):
+    """
+    Raised by the bulk helpers when some of the calls failed
+    and their exceptions aren't returned with the results
+    """
+
+    def __init__(self, message: str, results: list):
+        super().__init__(message)
+        #: The result or the exception raised by each call, in the order of the calls
+        self.results: list = results
+        #: The index in the calls and the exception raised by each call that failed
+        self.errors: list = [(index, result) for index, result in enumerate(results) if isinstance(result, Exception)]
@@ -0,0 +1,226 @@
+"""
+Hooks called around every request and a collector of request statistics built on them
+"""
+
+import re
+import threading
+from collections import Counter
+
+import httpx
+
+from .constants import ID_PATTERN
+
+#: Names of the hooks accepted by the ``hooks`` option and ``add_hook``
+HOOKS = ("before_request", "after_response", "on_error")
+
+#: Upper bounds in seconds of the buckets of the latency histograms
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+_ID_SEGMENT = re.compile(rf"(?<=/){ID_PATTERN}(?=/|$)")
+_NAME_SEGMENT = re.compile(r"/(name|username|email)/[^/]+")
+
+
+def endpoint_template(endpoint):
+    """
+    Replace the ids and names in an endpoint path by placeholders,
+    so the requests made to the same endpoint for different resources are counted together.
+
+    .. code:: python
+
+        >>> endpoint_template("/api/v4/users/ez6hmzkgwfdd9x7dh8csdx5tpr/teams")
+        '/api/v4/users/{id}/teams'
+        >>> endpoint_template("/api/v4/users/username/john.doe")
+        '/api/v4/users/username/{username}'
+    """
+    endpoint = _ID_SEGMENT.sub("{id}", endpoint)
+    return _NAME_SEGMENT.sub(r"/\1/{\1}", endpoint)
+
+
+class EndpointStats:
+    """Statistics of the requests made to one endpoint with one HTTP method"""
+
+    def __init__(self, buckets):
+        self.count = 0
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency_sum = 0.0
+        self.latency_buckets = dict.fromkeys(buckets, 0)
+
+    def observe(self, elapsed):
+        self.count += 1
+        self.latency_sum += elapsed
+        for bound in self.latency_buckets:
+            if elapsed <= bound:
+                self.latency_buckets[bound] += 1
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "latency_sum": self.latency_sum,
+            "latency_buckets": dict(self.latency_buckets),
+        }
+
+
+def _escape(value):
+    return str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+class StatsCollector:
+    """
+    Collects the number of requests, errors, bytes sent and received and a latency histogram
+    for each endpoint template (see :func:`endpoint_template`) and HTTP method,
+    and the number of errors by exception class.
+
+    Enabled with the ``collect_stats`` option of the drivers and read with ``driver.client.stats()``,
+    or installed on a client with :meth:`install`.
+
+    The latency of a request covers every attempt made, including the time spent waiting
+    before retries and to respect the server rate limits.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, prefix="mattermost_client"):
+        """
+        :param buckets: Upper bounds in seconds of the buckets of the latency histograms
+        :param prefix: Prefix of the metric names in the Prometheus export
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._endpoints = {}
+        self._errors = Counter()
+
+    def install(self, client):
+        """
+        Register the hooks of the collector on ``client``.
+
+        :param client: The ``Client`` or ``AsyncClient`` of a driver, e.g. ``driver.client``
+        """
+        client.add_hook("after_response", self.after_response)
+        client.add_hook("on_error", self.on_error)
+
+    def _endpoint(self, method, endpoint):
+        """Must be called with the lock held"""
+        key = (method.upper(), endpoint_template(endpoint))
+        stats = self._endpoints.get(key)
+        if stats is None:
+            stats = self._endpoints[key] = EndpointStats(self.buckets)
+        return stats
+
+    def after_response(self, method, endpoint, response, elapsed):
+        bytes_sent = int(response.request.headers.get("Content-Length", 0))
+        try:
+            bytes_received = len(response.content)
+        except httpx.ResponseNotRead:
+            # Streamed responses (downloads) are written as they are received
+            bytes_received = response.num_bytes_downloaded
+        with self._lock:
+            stats = self._endpoint(method, endpoint)
+            stats.observe(elapsed)
+            stats.bytes_sent += bytes_sent
+            stats.bytes_received += bytes_received
+
+    def on_error(self, method, endpoint, error, response, elapsed):
+        with self._lock:
+            stats = self._endpoint(method, endpoint)
+            if response is None:
+                # No response was received, so the request wasn't observed by after_response
+                stats.observe(elapsed)
+            stats.errors += 1
+            self._errors[type(error).__name__] += 1
+
+    def snapshot(self):
+        """
+        :return: A dict with the statistics of each endpoint, keyed by HTTP method and endpoint template
+            (``"GET /api/v4/users/{id}"``), under ``endpoints`` and the number of errors by exception class
+            under ``errors``
+        """
+        with self._lock:
+            return {
+                "endpoints": {
+                    f"{method} {template}": stats.as_dict() for (method, template), stats in self._endpoints.items()
+                },
+                "errors": dict(self._errors),
+            }
+
+    def reset(self):
+        """Forget all the statistics collected so far"""
+        with self._lock:
+            self._endpoints.clear()
+            self._errors.clear()
+
+    def prometheus(self):
+        """
+        :return: The statistics in the Prometheus text exposition format
+        """
+        prefix = self.prefix
+        with self._lock:
+            endpoints = [(method, template, stats.as_dict()) for (method, template), stats in self._endpoints.items()]
+            errors = dict(self._errors)
+
+        lines = []
+
+        def metric(name, kind, description, samples):
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            lines.extend(f"{prefix}_{sample}" for sample in samples)
+
+        metric(
+            "requests_total",
+            "counter",
+            "Requests made to the Mattermost API.",
+            (f"requests_total{_labels(method=m, endpoint=t)} {s['count']}" for m, t, s in endpoints),
+        )
+        metric(
+            "request_errors_total",
+            "counter",
+            "Requests to the Mattermost API that raised an exception.",
+            (f"request_errors_total{_labels(method=m, endpoint=t)} {s['errors']}" for m, t, s in endpoints),
+        )
+        metric(
+            "errors_total",
+            "counter",
+            "Exceptions raised by requests to the Mattermost API by class.",
+            (f"errors_total{_labels(exception=name)} {count}" for name, count in errors.items()),
+        )
+        metric(
+            "request_sent_bytes_total",
+            "counter",
+            "Bytes sent in request bodies.",
+            (f"request_sent_bytes_total{_labels(method=m, endpoint=t)} {s['bytes_sent']}" for m, t, s in endpoints),
+        )
+        metric(
+            "response_received_bytes_total",
+            "counter",
+            "Bytes received in response bodies.",
+            (
+                f"response_received_bytes_total{_labels(method=m, endpoint=t)} {s['bytes_received']}"
+                for m, t, s in endpoints
+            ),
+        )
+
+        histogram = []
+        for method, template, stats in endpoints:
+            for bound, count in stats["latency_buckets"].items():
+                histogram.append(
+                    f"request_duration_seconds_bucket{_labels(method=method, endpoint=template, le=bound)} {count}"
+                )
+            histogram.append(
+                f"request_duration_seconds_bucket{_labels(method=method, endpoint=template, le='+Inf')} {stats['count']}"
+            )
+            histogram.append(
+                f"request_duration_seconds_sum{_labels(method=method, endpoint=template)} {stats['latency_sum']}"
+            )
+            histogram.append(
+                f"request_duration_seconds_count{_labels(method=method, endpoint=template)} {stats['count']}"
+            )
+        metric("request_duration_seconds", "histogram", "Duration of requests to the Mattermost API.", histogram)
+
+        return "\n".join(lines) + "\n"
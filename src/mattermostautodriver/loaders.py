@@ -0,0 +1,469 @@
+"""
+Loaders batching lookups of single entities into the bulk endpoints of the API
+"""
+
+import asyncio
+import functools
+from typing import Any, NamedTuple
+
+from .bulk import async_gather, gather
+from .cache import TTLCache
+from .constants import DEFAULT_CONCURRENCY, MAX_BATCH_SIZE, STATUS_TTL
+from .endpoints.posts import Posts
+from .endpoints.reactions import Reactions
+from .endpoints.status import Status
+from .endpoints.users import Users
+
+
+def _chunks(keys, size):
+    for start in range(0, len(keys), size):
+        yield keys[start : start + size]
+
+
+class BatchLoader:
+    """
+    Looks up many keys with as few calls to ``batch_fn`` as possible.
+
+    ``batch_fn`` takes a list of at most ``max_batch_size`` keys and returns a dict of the values found by key.
+    """
+
+    def __init__(self, batch_fn, max_batch_size=MAX_BATCH_SIZE):
+        """
+        :param batch_fn: Function taking a list of keys and returning a dict of the values found by key
+        :param max_batch_size: The maximum number of keys passed to ``batch_fn`` at once
+        """
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+
+    def load(self, key):
+        """
+        :return: The value of ``key`` or None if it wasn't found
+        """
+        return self.load_many([key])[0]
+
+    def load_many(self, keys):
+        """
+        :return: A list with the value of each key, or None for the keys that weren't found
+        """
+        keys = list(keys)
+        values = {}
+        for chunk in _chunks(list(dict.fromkeys(keys)), self.max_batch_size):
+            values.update(self.batch_fn(chunk))
+        return [values.get(key) for key in keys]
+
+
+class AsyncBatchLoader:
+    """
+    Collects the keys loaded by every coroutine during one iteration of the event loop,
+    or during ``delay`` seconds, and looks them up with as few calls to ``batch_fn`` as possible.
+
+    Keys loaded again while their batch is in flight share its result.
+
+    .. code:: python
+
+        async def get_users(user_ids):
+            return {user["id"]: user for user in await driver.users.get_users_by_ids(user_ids)}
+
+        loader = AsyncBatchLoader(get_users)
+        # A single request is sent for both users
+        alice, bob = await asyncio.gather(loader.load(alice_id), loader.load(bob_id))
+    """
+
+    def __init__(self, batch_fn, max_batch_size=MAX_BATCH_SIZE, delay=0):
+        """
+        :param batch_fn: Coroutine function taking a list of keys and returning a dict of the values found by key
+        :param max_batch_size: The maximum number of keys passed to ``batch_fn`` at once,
+            a batch is sent as soon as it is full
+        :param delay: Seconds to wait for more keys before sending a batch,
+            by default keys are collected until the event loop runs the next batch of callbacks
+        """
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.delay = delay
+        self._batch = {}
+        self._in_flight = {}
+        self._handle = None
+        # The event loop only keeps weak references to tasks
+        self._tasks = set()
+
+    async def load(self, key):
+        """
+        :return: The value of ``key`` or None if it wasn't found
+        """
+        future = self._batch.get(key) or self._in_flight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._batch[key] = loop.create_future()
+            if len(self._batch) >= self.max_batch_size:
+                self._dispatch()
+            elif self._handle is None:
+                if self.delay:
+                    self._handle = loop.call_later(self.delay, self._dispatch)
+                else:
+                    self._handle = loop.call_soon(self._dispatch)
+
+        # Shielded so a cancelled caller doesn't cancel the lookup for the others waiting on the same key
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys):
+        """
+        :return: A list with the value of each key, or None for the keys that weren't found
+        """
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        batch, self._batch = self._batch, {}
+        if batch:
+            self._in_flight.update(batch)
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _forget(self, batch):
+        for key, future in batch.items():
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    async def _run(self, batch):
+        try:
+            values = await self.batch_fn(list(batch))
+        except Exception as e:
+            self._forget(batch)
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+                    # Retrieved here in case every caller waiting on this key was cancelled
+                    future.exception()
+            return
+
+        self._forget(batch)
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(values.get(key))
+
+
+class BaseUserLoader:
+    def __init__(self, client):
+        """
+        :param client: The ``Client`` or ``AsyncClient`` of a logged in driver, e.g. ``driver.client``
+        """
+        self.users = Users(client)
+
+    @staticmethod
+    def _by_id(users):
+        return {user["id"]: user for user in users}
+
+    @staticmethod
+    def _by_username(users):
+        return {user["username"]: user for user in users}
+
+
+class UserLoader(BaseUserLoader):
+    """
+    Looks up users by id or username with ``Users.get_users_by_ids`` and ``Users.get_users_by_usernames``,
+    sending at most :data:`~mattermostautodriver.constants.MAX_BATCH_SIZE` ids per request.
+
+    .. code:: python
+
+        from mattermostautodriver.loaders import UserLoader
+
+        authors = UserLoader(driver.client).load_many(post["user_id"] for post in posts)
+    """
+
+    def __init__(self, client, max_batch_size=MAX_BATCH_SIZE):
+        super().__init__(client)
+        self.by_id = BatchLoader(lambda ids: self._by_id(self.users.get_users_by_ids(ids)), max_batch_size)
+        self.by_username = BatchLoader(
+            lambda usernames: self._by_username(self.users.get_users_by_usernames(usernames)), max_batch_size
+        )
+
+    def load(self, user_id):
+        """
+        :return: The user with ``user_id`` or None if it doesn't exist
+        """
+        return self.by_id.load(user_id)
+
+    def load_many(self, user_ids):
+        """
+        :return: A list with the user of each id, or None for the ids that don't exist
+        """
+        return self.by_id.load_many(user_ids)
+
+    def load_by_username(self, username):
+        """
+        :return: The user named ``username`` or None if it doesn't exist
+        """
+        return self.by_username.load(username)
+
+    def load_many_by_username(self, usernames):
+        """
+        :return: A list with the user of each username, or None for the usernames that don't exist
+        """
+        return self.by_username.load_many(usernames)
+
+
+class AsyncUserLoader(BaseUserLoader):
+    """
+    Batches the user lookups made by concurrent coroutines into ``Users.get_users_by_ids``
+    and ``Users.get_users_by_usernames`` requests of at most
+    :data:`~mattermostautodriver.constants.MAX_BATCH_SIZE` ids, see :class:`AsyncBatchLoader`.
+
+    .. code:: python
+
+        from mattermostautodriver.loaders import AsyncUserLoader
+
+        users = AsyncUserLoader(driver.client)
+
+        async def handle_posted(post):
+            # Concurrent handlers share a single request
+            author = await users.load(post["user_id"])
+    """
+
+    def __init__(self, client, max_batch_size=MAX_BATCH_SIZE, delay=0):
+        """
+        :param client: The ``AsyncClient`` of a logged in driver, e.g. ``driver.client``
+        :param max_batch_size: The maximum number of ids sent in one request
+        :param delay: Seconds to wait for more lookups before sending a request, see :class:`AsyncBatchLoader`
+        """
+        super().__init__(client)
+        self.by_id = AsyncBatchLoader(self._load_by_ids, max_batch_size, delay)
+        self.by_username = AsyncBatchLoader(self._load_by_usernames, max_batch_size, delay)
+
+    async def _load_by_ids(self, user_ids):
+        return self._by_id(await self.users.get_users_by_ids(user_ids))
+
+    async def _load_by_usernames(self, usernames):
+        return self._by_username(await self.users.get_users_by_usernames(usernames))
+
+    async def load(self, user_id):
+        """
+        :return: The user with ``user_id`` or None if it doesn't exist
+        """
+        return await self.by_id.load(user_id)
+
+    async def load_many(self, user_ids):
+        """
+        :return: A list with the user of each id, or None for the ids that don't exist
+        """
+        return await self.by_id.load_many(user_ids)
+
+    async def load_by_username(self, username):
+        """
+        :return: The user named ``username`` or None if it doesn't exist
+        """
+        return await self.by_username.load(username)
+
+    async def load_many_by_username(self, usernames):
+        """
+        :return: A list with the user of each username, or None for the usernames that don't exist
+        """
+        return await self.by_username.load_many(usernames)
+
+
+class BaseStatusLoader:
+    def __init__(self, client, ttl=STATUS_TTL, maxsize=None):
+        """
+        :param client: The ``Client`` or ``AsyncClient`` of a logged in driver, e.g. ``driver.client``
+        :param ttl: Seconds during which a status is reused instead of being requested again
+        :param maxsize: The maximum number of statuses kept, or None for no limit
+        """
+        self.status = Status(client)
+        self.cache = TTLCache(ttl, maxsize)
+
+    def _cache_statuses(self, statuses):
+        """
+        Cache the statuses received from the server.
+
+        :return: A dict of the statuses by user id
+        """
+        by_user_id = {status["user_id"]: status for status in statuses}
+        for user_id, status in by_user_id.items():
+            self.cache.set(user_id, status)
+        return by_user_id
+
+
+class StatusLoader(BaseStatusLoader):
+    """
+    Looks up user statuses with ``Status.get_users_statuses_by_ids``, sending at most
+    :data:`~mattermostautodriver.constants.MAX_BATCH_SIZE` ids per request
+    and reusing the statuses received during the last ``ttl`` seconds.
+
+    .. code:: python
+
+        from mattermostautodriver.loaders import StatusLoader
+
+        statuses = StatusLoader(driver.client)
+        online = [user for user, status in zip(users, statuses.load_many(user_ids)) if status["status"] == "online"]
+    """
+
+    def __init__(self, client, ttl=STATUS_TTL, maxsize=None, max_batch_size=MAX_BATCH_SIZE):
+        super().__init__(client, ttl, maxsize)
+        self.by_user_id = BatchLoader(
+            lambda user_ids: self._cache_statuses(self.status.get_users_statuses_by_ids(user_ids)), max_batch_size
+        )
+
+    def load(self, user_id):
+        """
+        :return: The status of the user with ``user_id`` or None if it doesn't exist
+        """
+        return self.load_many([user_id])[0]
+
+    def load_many(self, user_ids):
+        """
+        :return: A list with the status of each user, or None for the users that don't exist
+        """
+        user_ids = list(user_ids)
+        statuses = [self.cache.get(user_id) for user_id in user_ids]
+        missing = [user_id for user_id, status in zip(user_ids, statuses) if status is None]
+        if missing:
+            loaded = dict(zip(missing, self.by_user_id.load_many(missing)))
+            statuses = [loaded[user_id] if status is None else status for user_id, status in zip(user_ids, statuses)]
+        return statuses
+
+
+class AsyncStatusLoader(BaseStatusLoader):
+    """
+    Batches the status lookups made by concurrent coroutines into ``Status.get_users_statuses_by_ids``
+    requests, see :class:`AsyncBatchLoader`, reusing the statuses received during the last ``ttl`` seconds.
+
+    .. code:: python
+
+        from mattermostautodriver.loaders import AsyncStatusLoader
+
+        statuses = AsyncStatusLoader(driver.client)
+        status = await statuses.load(user_id)
+    """
+
+    def __init__(self, client, ttl=STATUS_TTL, maxsize=None, max_batch_size=MAX_BATCH_SIZE, delay=0):
+        """
+        :param client: The ``AsyncClient`` of a logged in driver, e.g. ``driver.client``
+        :param ttl: Seconds during which a status is reused instead of being requested again
+        :param maxsize: The maximum number of statuses kept, or None for no limit
+        :param max_batch_size: The maximum number of ids sent in one request
+        :param delay: Seconds to wait for more lookups before sending a request, see :class:`AsyncBatchLoader`
+        """
+        super().__init__(client, ttl, maxsize)
+        self.by_user_id = AsyncBatchLoader(self._load_by_user_ids, max_batch_size, delay)
+
+    async def _load_by_user_ids(self, user_ids):
+        return self._cache_statuses(await self.status.get_users_statuses_by_ids(user_ids))
+
+    async def load(self, user_id):
+        """
+        :return: The status of the user with ``user_id`` or None if it doesn't exist
+        """
+        status = self.cache.get(user_id)
+        if status is None:
+            status = await self.by_user_id.load(user_id)
+        return status
+
+    async def load_many(self, user_ids):
+        """
+        :return: A list with the status of each user, or None for the users that don't exist
+        """
+        return list(await asyncio.gather(*(self.load(user_id) for user_id in user_ids)))
+
+
+class HydratedPost(NamedTuple):
+    """A post with its reactions and author, as returned by :func:`hydrate_posts`"""
+
+    post: dict[str, Any]
+    reactions: list[dict[str, Any]]
+    #: None if the author doesn't exist anymore
+    author: dict[str, Any] | None
+
+
+def _join_posts(post_ids, posts, reactions, authors):
+    """
+    :return: The posts found in ``posts`` joined with their reactions and author, in the order of ``post_ids``
+    """
+    posts = {post["id"]: post for post in posts}
+    return [
+        HydratedPost(posts[post_id], reactions.get(post_id) or [], authors.get(posts[post_id]["user_id"]))
+        for post_id in post_ids
+        if post_id in posts
+    ]
+
+
+def hydrate_posts(client, post_ids, concurrency=DEFAULT_CONCURRENCY, users=None):
+    """
+    Fetch many posts with their reactions and authors using the bulk endpoints
+    ``Posts.get_posts_by_ids``, ``Reactions.get_bulk_reactions`` and ``Users.get_users_by_ids``.
+
+    Posts and reactions are requested in chunks of :data:`~mattermostautodriver.constants.MAX_BATCH_SIZE` ids
+    in a pool of threads, see :func:`mattermostautodriver.bulk.gather`, followed by the authors of the posts.
+
+    .. code:: python
+
+        from mattermostautodriver.loaders import hydrate_posts
+
+        for post, reactions, author in hydrate_posts(driver.client, post_ids):
+            print(author["username"], post["message"], len(reactions))
+
+    :param client: The ``Client`` of a logged in driver, e.g. ``driver.client``
+    :param post_ids: The ids of the posts
+    :param concurrency: The maximum number of requests in flight at once
+    :param users: The :class:`UserLoader` used to look up authors, a new one by default
+    :raises BulkError: If any of the requests failed
+    :return: A list of :class:`HydratedPost` in the order of ``post_ids``, posts that don't exist are left out
+    """
+    post_ids = list(dict.fromkeys(post_ids))
+    posts_api, reactions_api = Posts(client), Reactions(client)
+    users = users or UserLoader(client)
+
+    chunks = list(_chunks(post_ids, MAX_BATCH_SIZE))
+    results = gather(
+        [functools.partial(posts_api.get_posts_by_ids, chunk) for chunk in chunks]
+        + [functools.partial(reactions_api.get_bulk_reactions, chunk) for chunk in chunks],
+        concurrency,
+        return_exceptions=False,
+    )
+    posts = [post for chunk_posts in results[: len(chunks)] for post in chunk_posts]
+    reactions = {
+        post_id: value for chunk_reactions in results[len(chunks) :] for post_id, value in chunk_reactions.items()
+    }
+
+    author_ids = list(dict.fromkeys(post["user_id"] for post in posts))
+    authors = dict(zip(author_ids, users.load_many(author_ids)))
+
+    return _join_posts(post_ids, posts, reactions, authors)
+
+
+async def async_hydrate_posts(client, post_ids, concurrency=DEFAULT_CONCURRENCY, users=None):
+    """
+    Asynchronous version of :func:`hydrate_posts`.
+
+    Reactions are requested while the posts and then their authors are.
+
+    :param client: The ``AsyncClient`` of a logged in driver, e.g. ``driver.client``
+    :param post_ids: The ids of the posts
+    :param concurrency: The maximum number of requests in flight at once for each kind of request
+    :param users: The :class:`AsyncUserLoader` used to look up authors, a new one by default
+    :raises BulkError: If any of the requests failed
+    :return: A list of :class:`HydratedPost` in the order of ``post_ids``, posts that don't exist are left out
+    """
+    post_ids = list(dict.fromkeys(post_ids))
+    posts_api, reactions_api = Posts(client), Reactions(client)
+    users = users or AsyncUserLoader(client)
+    chunks = list(_chunks(post_ids, MAX_BATCH_SIZE))
+
+    async def load_posts_and_authors():
+        results = await async_gather(
+            (posts_api.get_posts_by_ids(chunk) for chunk in chunks), concurrency, return_exceptions=False
+        )
+        posts = [post for chunk_posts in results for post in chunk_posts]
+        author_ids = list(dict.fromkeys(post["user_id"] for post in posts))
+        return posts, dict(zip(author_ids, await users.load_many(author_ids)))
+
+    async def load_reactions():
+        results = await async_gather(
+            (reactions_api.get_bulk_reactions(chunk) for chunk in chunks), concurrency, return_exceptions=False
+        )
+        return {post_id: value for chunk_reactions in results for post_id, value in chunk_reactions.items()}
+
+    (posts, authors), reactions = await asyncio.gather(load_posts_and_authors(), load_reactions())
+    return _join_posts(post_ids, posts, reactions, authors)
@@ -0,0 +1,173 @@
+"""
+Helpers to walk through paginated endpoints (those accepting ``page`` and
+``per_page``) without having to keep track of the current page manually
+"""
+
+import asyncio
+import inspect
+import math
+from collections import deque
+
+from .constants import MAX_PER_PAGE
+
+#: Keys holding the number of items in the responses accepted by the ``total`` argument of :func:`async_paginate`
+TOTAL_COUNT_KEYS = ("total_count", "total_users_count", "total_member_count", "member_count")
+
+
+def page_items(response):
+    """
+    Extract the list of items contained in one page of results.
+
+    Most paginated endpoints return a plain list. Post lists are returned as
+    ``{"order": [...], "posts": {...}}`` and are flattened respecting ``order``.
+    Responses requested with ``include_total_count`` wrap the list in a dict
+    (e.g. ``{"channels": [...], "total_count": 0}``) and the list is unwrapped.
+
+    :param response: The decoded JSON response of a paginated endpoint
+    :return: The list of items in the page
+    """
+    if isinstance(response, list):
+        return response
+
+    if isinstance(response, dict):
+        if "order" in response and "posts" in response:
+            posts = response["posts"] or {}
+            return [posts[post_id] for post_id in response["order"] or ()]
+
+        lists = [value for value in response.values() if isinstance(value, list)]
+        if len(lists) == 1:
+            return lists[0]
+
+    raise TypeError(f"Unable to extract a list of items from a response of type {type(response).__name__}")
+
+
+def paginate(endpoint, *args, page=0, per_page=MAX_PER_PAGE, items=page_items, **kwargs):
+    """
+    Lazily iterate over all items of a paginated endpoint.
+
+    Pages are only requested when the previous one has been consumed and
+    iteration stops on the first page with less than ``per_page`` items.
+
+    .. code:: python
+
+        from mattermostautodriver.pagination import paginate
+
+        for user in paginate(driver.users.get_users, in_team=team_id):
+            print(user["username"])
+
+    :param endpoint: A bound endpoint method accepting ``page`` and ``per_page``, e.g. ``driver.users.get_users``
+    :param args: Positional arguments passed on every call to ``endpoint``
+    :param page: The first page to request
+    :param per_page: The number of items per page, defaults to :data:`~mattermostautodriver.constants.MAX_PER_PAGE`
+    :param items: Function extracting the list of items from a response, see :func:`page_items`
+    :param kwargs: Keyword arguments passed on every call to ``endpoint``
+    :return: A generator yielding one item at a time
+    """
+    while True:
+        response = endpoint(*args, page=page, per_page=per_page, **kwargs)
+        results = items(response)
+
+        yield from results
+
+        if len(results) < per_page:
+            return
+
+        page += 1
+
+
+async def _resolve_total(total):
+    """Turn the ``total`` argument of :func:`async_paginate` into an integer"""
+    if inspect.isawaitable(total):
+        total = await total
+
+    if isinstance(total, dict):
+        for key in TOTAL_COUNT_KEYS:
+            if key in total:
+                return int(total[key])
+
+        raise ValueError(f"Unable to find a total count in {sorted(total)}")
+
+    return int(total)
+
+
+async def async_paginate(
+    endpoint, *args, page=0, per_page=MAX_PER_PAGE, items=page_items, prefetch=0, total=None, **kwargs
+):
+    """
+    Asynchronous version of :func:`paginate` to be used with the ``AsyncTypedDriver``.
+
+    With ``prefetch`` greater than 0, up to ``prefetch`` pages following the one
+    being consumed are requested concurrently. Items are still yielded in order.
+
+    If the number of items is known, passing it as ``total`` avoids requesting pages
+    past the end of the results. It can be an integer, the response of a stats endpoint
+    (e.g. ``Users.get_total_users_stats``, ``Channels.get_channel_stats`` or
+    ``Teams.get_team_stats``) or an awaitable returning one of those.
+
+    .. code:: python
+
+        from mattermostautodriver.pagination import async_paginate
+
+        async for user in async_paginate(driver.users.get_users, in_team=team_id):
+            print(user["username"])
+
+        async for member in async_paginate(
+            driver.teams.get_team_members,
+            team_id,
+            prefetch=8,
+            total=driver.teams.get_team_stats(team_id),
+        ):
+            print(member["user_id"])
+
+    :param endpoint: A bound endpoint coroutine method accepting ``page`` and ``per_page``
+    :param args: Positional arguments passed on every call to ``endpoint``
+    :param page: The first page to request
+    :param per_page: The number of items per page, defaults to :data:`~mattermostautodriver.constants.MAX_PER_PAGE`
+    :param items: Function extracting the list of items from a response, see :func:`page_items`
+    :param prefetch: The number of pages to request ahead of the one being consumed
+    :param total: The total number of items across all pages, counted from page 0
+    :param kwargs: Keyword arguments passed on every call to ``endpoint``
+    :return: An asynchronous generator yielding one item at a time
+    """
+    last_page = None
+    if total is not None:
+        total = await _resolve_total(total)
+        last_page = math.ceil(total / per_page) - 1
+
+        if page > last_page:
+            return
+
+    pending = deque()
+    next_page = page
+
+    def request_pages(window):
+        nonlocal next_page
+        while len(pending) < window and (last_page is None or next_page <= last_page):
+            pending.append(asyncio.ensure_future(endpoint(*args, page=next_page, per_page=per_page, **kwargs)))
+            next_page += 1
+
+    try:
+        while True:
+            request_pages(prefetch + 1)
+
+            if not pending:
+                # The last known page was full, so the total we were given is outdated
+                last_page = None
+                continue
+
+            results = items(await pending.popleft())
+            finished = len(results) < per_page
+
+            if not finished:
+                # Keep requests in flight while the caller consumes the current page
+                request_pages(prefetch)
+
+            for item in results:
+                yield item
+
+            if finished:
+                return
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
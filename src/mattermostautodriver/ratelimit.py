@@ -0,0 +1,105 @@
+"""
+Client side pacing of requests based on the rate limiting headers sent by Mattermost
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket shared by every request made through a client, kept in sync with the
+    ``X-RateLimit-Limit``, ``X-RateLimit-Remaining`` and ``X-RateLimit-Reset`` response headers.
+
+    Nothing is paced until the server announces a limit. Afterwards each request takes a token
+    and, once the bucket is empty, is delayed until the server is expected to accept it again.
+    The bucket is protected by a lock so it can be shared by threads and coroutines alike,
+    waiting is left to the caller.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._capacity = None
+        self._tokens = None
+        self._rate = None
+        self._updated_at = 0.0
+        self._blocked_until = 0.0
+
+    def _refill(self, now):
+        """Add the tokens regained since the last update, must be called with the lock held"""
+        if self._rate:
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+    def reserve(self):
+        """
+        Take a token for a request about to be sent.
+
+        :return: The number of seconds to wait before sending the request
+        """
+        with self._lock:
+            now = time.monotonic()
+            delay = max(self._blocked_until - now, 0.0)
+
+            if self._tokens is None:
+                return delay
+
+            self._refill(now)
+            self._tokens -= 1
+
+            if self._tokens < 0 and self._rate:
+                delay = max(delay, -self._tokens / self._rate)
+
+            return delay
+
+    def update(self, headers):
+        """
+        Synchronise the bucket with the rate limiting headers of a response.
+
+        :param headers: The headers of a response
+        """
+        try:
+            limit = int(headers["X-RateLimit-Limit"])
+            remaining = int(headers["X-RateLimit-Remaining"])
+            reset = float(headers["X-RateLimit-Reset"])
+        except (KeyError, ValueError):
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            if self._tokens is None:
+                self._tokens = remaining
+            else:
+                self._refill(now)
+                # The server doesn't know yet about requests still in flight, which were already
+                # taken from our bucket, so only trust it when it has less tokens left than us
+                self._tokens = min(self._tokens, remaining)
+            self._capacity = limit
+            self._updated_at = now
+            if reset > 0 and remaining < limit:
+                # X-RateLimit-Reset is the number of seconds until the bucket is full again, rounded up,
+                # so this underestimates the refill rate and the best estimate is the highest one seen
+                self._rate = max(self._rate or 0, (limit - remaining) / reset)
+
+    def throttle(self, headers):
+        """
+        Hold back every request after the server refused one with ``429 Too Many Requests``.
+
+        :param headers: The headers of the refused response
+        :return: The number of seconds to wait before retrying
+        """
+        delay = None
+        for header in ("Retry-After", "X-RateLimit-Reset"):
+            try:
+                delay = float(headers[header])
+                break
+            except (KeyError, ValueError):
+                continue
+
+        if delay is None or delay <= 0:
+            delay = 1.0
+
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+
+        return delay
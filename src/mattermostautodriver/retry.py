@@ -0,0 +1,138 @@
+"""
+Retry policies for requests failing with transient errors
+"""
+
+import random
+import re
+
+import httpx
+
+#: Errors raised before the request reached the server, which makes them safe to retry for any request
+UNSENT_REQUEST_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class RetryPolicy:
+    """
+    Decides which failed requests are sent again and how long to wait before doing so.
+
+    Only requests that can safely be repeated are retried: by default those using
+    ``GET``, ``PUT`` or ``DELETE`` and ``POST`` requests whose body carries an
+    idempotency key such as the ``pending_post_id`` of a post. Requests refused with
+    ``429 Too Many Requests`` or that never reached the server (see :data:`UNSENT_REQUEST_ERRORS`)
+    are retried whatever their method.
+
+    The delay between attempts grows exponentially (``backoff_factor * 2 ** retry``) up to
+    ``max_backoff`` seconds and, with ``jitter``, a random delay up to that value is used instead.
+
+    .. code:: python
+
+        from mattermostautodriver import TypedDriver
+        from mattermostautodriver.retry import RetryPolicy
+
+        driver = TypedDriver({
+            "url": "mattermost.server.com",
+            "token": "YourPersonalAccessToken",
+            "retry_policy": RetryPolicy(
+                max_retries=5,
+                overrides={
+                    # Never retry pings, give slow exports more time
+                    r"/api/v4/system/ping": None,
+                    r"/api/v4/exports/.*": RetryPolicy(max_retries=10, backoff_factor=2),
+                },
+            ),
+        })
+    """
+
+    def __init__(
+        self,
+        max_retries=3,
+        backoff_factor=0.5,
+        max_backoff=30,
+        jitter=True,
+        statuses=(429, 502, 503, 504),
+        methods=("get", "put", "delete"),
+        idempotency_keys=("pending_post_id",),
+        overrides=None,
+    ):
+        """
+        :param max_retries: The maximum number of times a request is retried
+        :param backoff_factor: The delay in seconds before the first retry
+        :param max_backoff: The maximum delay in seconds between two attempts
+        :param jitter: Randomize delays so clients failing together don't retry together
+        :param statuses: HTTP status codes considered transient
+        :param methods: HTTP methods safe to retry
+        :param idempotency_keys: Keys of a request body making it safe to retry when present
+        :param overrides: A dict of regular expressions matching the full endpoint path of a request
+            to the policy to use instead of this one, or None to never retry matching requests
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(method.lower() for method in methods)
+        self.idempotency_keys = tuple(idempotency_keys)
+        self.overrides = [(re.compile(pattern), policy) for pattern, policy in (overrides or {}).items()]
+
+    def for_endpoint(self, endpoint):
+        """
+        :param endpoint: The endpoint path of a request, e.g. ``/api/v4/users/me``
+        :return: The policy applying to ``endpoint`` or None if requests to it are never retried
+        """
+        for pattern, policy in self.overrides:
+            if pattern.fullmatch(endpoint):
+                return policy
+        return self
+
+    def is_idempotent(self, method, options=None):
+        """
+        :param method: The HTTP method of the request
+        :param options: The JSON body of the request
+        :return: True if sending the request more than once has the same effect as sending it once
+        """
+        method = method.lower()
+        if method in self.methods:
+            return True
+        if method == "post" and isinstance(options, dict):
+            return any(options.get(key) for key in self.idempotency_keys)
+        return False
+
+    def should_retry(self, retries, method, options=None, response=None, error=None):
+        """
+        :param retries: The number of times the request was already retried
+        :param method: The HTTP method of the request
+        :param options: The JSON body of the request
+        :param response: The response received, if any
+        :param error: The exception raised while sending the request, if any
+        :return: True if the request should be sent again
+        """
+        if retries >= self.max_retries:
+            return False
+
+        if error is not None:
+            if isinstance(error, UNSENT_REQUEST_ERRORS):
+                return True
+            return isinstance(error, httpx.TransportError) and self.is_idempotent(method, options)
+
+        if response is None or response.status_code not in self.statuses:
+            return False
+
+        return response.status_code == 429 or self.is_idempotent(method, options)
+
+    def backoff(self, retries, response=None):
+        """
+        :param retries: The number of times the request was already retried
+        :param response: The response received, if any, whose ``Retry-After`` header is honoured
+        :return: The number of seconds to wait before the next attempt
+        """
+        delay = min(self.max_backoff, self.backoff_factor * 2**retries)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+
+        if response is not None:
+            try:
+                delay = max(delay, float(response.headers["Retry-After"]))
+            except (KeyError, ValueError):
+                pass
+
+        return delay
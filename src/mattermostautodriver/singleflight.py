@@ -0,0 +1,82 @@
+"""
+Coalescing of identical requests made at the same time into a single one
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """
+    Shares the result of a call with every thread making the same call while it is in flight.
+
+    The first thread calling :meth:`do` for a key runs the call, the others wait for it and get the same
+    result or exception. Results are shared and should be treated as read-only.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, func, *args, **kwargs):
+        """
+        :param key: A hashable identifying the call
+        :param func: The function to call if no call is in flight for ``key``
+        :return: The result of the call in flight for ``key``
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            self._forget(key)
+            future.set_exception(e)
+            raise
+
+        self._forget(key)
+        future.set_result(result)
+        return result
+
+    def _forget(self, key):
+        # Calls made from now on are sent again instead of getting a result that may be outdated
+        with self._lock:
+            del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """
+    Asynchronous version of :class:`SingleFlight` sharing the result of a coroutine.
+
+    The shared call runs in its own task, so cancelling one of the callers doesn't cancel it for the others.
+    """
+
+    def __init__(self):
+        self._calls = {}
+
+    async def do(self, key, func, *args, **kwargs):
+        """
+        :param key: A hashable identifying the call
+        :param func: The coroutine function to call if no call is in flight for ``key``
+        :return: The result of the call in flight for ``key``
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(func(*args, **kwargs))
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key, task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved in case every caller was cancelled before the call ended
+        if not task.cancelled():
+            task.exception()
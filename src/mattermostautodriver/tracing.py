@@ -0,0 +1,195 @@
+"""
+Tracing of requests and websocket events
+
+A tracer is set with the ``tracer`` option of the drivers. It creates a span around every request
+made with ``make_request`` and around every websocket event passed to the ``event_handler``.
+
+A tracer has a ``start_span(name, attributes)`` method returning a context manager
+that gives a span with a ``set_attribute(key, value)`` method and ends it on exit,
+which is what OpenTelemetry tracers do, see :class:`OpenTelemetryTracer`.
+
+The spans of the requests made by the endpoints of a driver are given the name of the endpoint method
+in their ``mattermost.endpoint`` attribute, see :func:`traced_endpoint`.
+"""
+
+import contextvars
+import functools
+import inspect
+import time
+
+#: Name of the endpoint method running in the current thread or task, e.g. ``Users.get_user``,
+#: set by the endpoint classes of :func:`traced_endpoint`
+ENDPOINT = contextvars.ContextVar("mattermostautodriver_endpoint", default=None)
+
+
+class NoOpSpan:
+    """Span doing nothing, used when tracing is disabled"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set_attribute(self, key, value):
+        pass
+
+
+NOOP_SPAN = NoOpSpan()
+
+
+class NoOpTracer:
+    """Tracer doing nothing, the default"""
+
+    #: Checked by the clients to skip collecting span attributes
+    enabled = False
+
+    def start_span(self, name, attributes=None):
+        return NOOP_SPAN
+
+
+class RecordedSpan:
+    """Span kept in memory by :class:`InMemoryTracer`"""
+
+    def __init__(self, tracer, name, attributes=None):
+        self._tracer = tracer
+        self._token = None
+        #: The span that was current when this one started
+        self.parent = None
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.start = None
+        self.end = None
+        #: The exception raised in the span, if any
+        self.error = None
+
+    @property
+    def duration(self):
+        """Duration of the span in seconds"""
+        return self.end - self.start
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def __enter__(self):
+        self.parent = self._tracer.current_span()
+        self._token = self._tracer._current.set(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end = time.perf_counter()
+        self.error = exc
+        self._tracer._current.reset(self._token)
+        self._tracer.spans.append(self)
+        return False
+
+
+class InMemoryTracer:
+    """
+    Tracer keeping the finished spans in :attr:`spans`, in the order they ended, meant for tests and debugging.
+
+    .. code:: python
+
+        from mattermostautodriver.tracing import InMemoryTracer
+
+        tracer = InMemoryTracer()
+        driver = TypedDriver({"url": "mattermost.server.com", "token": "...", "tracer": tracer})
+        driver.login()
+        print([(span.name, span.duration) for span in tracer.spans])
+    """
+
+    enabled = True
+
+    def __init__(self):
+        #: The finished spans
+        self.spans = []
+        self._current = contextvars.ContextVar(f"mattermostautodriver_span_{id(self)}", default=None)
+
+    def start_span(self, name, attributes=None):
+        return RecordedSpan(self, name, attributes)
+
+    def current_span(self):
+        """
+        :return: The span in progress in the current thread or task, if any
+        """
+        return self._current.get()
+
+    def clear(self):
+        """Forget the finished spans"""
+        self.spans.clear()
+
+
+class OpenTelemetryTracer:
+    """
+    Adapter for an `OpenTelemetry <https://opentelemetry.io/docs/languages/python/>`_ tracer,
+    requires the ``opentelemetry-api`` package.
+
+    Spans are made current while they are in progress, so the requests made by an event handler
+    are children of the span of the websocket event.
+
+    .. code:: python
+
+        from mattermostautodriver.tracing import OpenTelemetryTracer
+
+        driver = AsyncTypedDriver({"url": "mattermost.server.com", "token": "...", "tracer": OpenTelemetryTracer()})
+    """
+
+    enabled = True
+
+    def __init__(self, tracer=None):
+        """
+        :param tracer: The OpenTelemetry tracer to use, by default the one named ``mattermostautodriver``
+            from the global tracer provider
+        """
+        if tracer is None:
+            from opentelemetry import trace
+
+            tracer = trace.get_tracer("mattermostautodriver")
+        self._tracer = tracer
+
+    def start_span(self, name, attributes=None):
+        # Exceptions raised in the span are recorded and set its status
+        return self._tracer.start_as_current_span(name, attributes=attributes)
+
+
+def _traced_method(name, method):
+    @functools.wraps(method)
+    def traced(*args, **kwargs):
+        token = ENDPOINT.set(name)
+        try:
+            result = method(*args, **kwargs)
+        finally:
+            ENDPOINT.reset(token)
+        if inspect.isawaitable(result):
+            # The request of the async client is only made once awaited
+            return _awaited(name, result)
+        return result
+
+    return traced
+
+
+async def _awaited(name, awaitable):
+    token = ENDPOINT.set(name)
+    try:
+        return await awaitable
+    finally:
+        ENDPOINT.reset(token)
+
+
+@functools.cache
+def traced_endpoint(endpoint_class):
+    """
+    Build a subclass of an endpoint class whose methods set :data:`ENDPOINT` while they run,
+    so the spans of their requests are given the name of the endpoint method.
+
+    The drivers use it instead of the endpoint class when tracing is enabled.
+
+    :param endpoint_class: An endpoint class, e.g. ``Users``
+    :return: The subclass, with the same name
+    """
+    attributes = {"__module__": endpoint_class.__module__, "__doc__": endpoint_class.__doc__}
+    for name, function in vars(endpoint_class).items():
+        if not name.startswith("_") and inspect.isfunction(function):
+            attributes[name] = _traced_method(f"{endpoint_class.__name__}.{name}", function)
+    return type(endpoint_class.__name__, (endpoint_class,), attributes)
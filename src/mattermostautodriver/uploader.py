@@ -0,0 +1,230 @@
+"""
+High level helpers to send large files using resumable upload sessions
+(see the ``Uploads`` endpoints) without loading them in memory
+"""
+
+import asyncio
+import logging
+import mmap
+import os
+import time
+
+import httpx
+
+from .constants import UPLOAD_CHUNK_SIZE
+from .endpoints.uploads import Uploads
+from .exceptions import InvalidMattermostError, MattermostError
+
+#: Status codes of the server side failures after which an upload is resumed
+RETRYABLE_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+log = logging.getLogger("mattermostautodriver.api")
+log.setLevel(logging.INFO)
+
+
+class BaseUploader:
+    def __init__(self, client, chunk_size=UPLOAD_CHUNK_SIZE, max_retries=5, retry_delay=1):
+        """
+        :param client: The ``Client`` or ``AsyncClient`` of a logged in driver, e.g. ``driver.client``
+        :param chunk_size: The size in bytes of the chunks sent on each request
+        :param max_retries: The number of consecutive failures after which the upload is aborted
+        :param retry_delay: Seconds to wait before resuming after a failure
+        """
+        self.client = client
+        self.uploads = Uploads(client)
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+
+    @staticmethod
+    def _session_options(path, channel_id, filename, upload_type):
+        return {
+            "channel_id": channel_id,
+            "filename": filename or os.path.basename(path),
+            "file_size": os.path.getsize(path),
+            "type": upload_type,
+        }
+
+    @staticmethod
+    def _map_file(fh, size):
+        """
+        :return: A read-only memory map of ``fh`` or an empty bytes object for empty files,
+            which can't be memory-mapped
+        """
+        if size == 0:
+            return b""
+        return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @staticmethod
+    def _is_retryable(error):
+        """
+        :return: True if ``error`` is a network error or a server side error after which the upload can be resumed
+        """
+        if isinstance(error, httpx.TransportError):
+            return True
+        if isinstance(error, (MattermostError, InvalidMattermostError)):
+            # Not 501, sent when uploads are disabled on the server
+            return error.status_code in RETRYABLE_STATUS_CODES
+        return False
+
+    def _handle_failure(self, error, failures, upload_id):
+        if not self._is_retryable(error) or failures > self.max_retries:
+            raise error
+        log.warning(f"Upload {upload_id} failed ({type(error).__name__}), resuming in {self.retry_delay}s")
+
+
+class Uploader(BaseUploader):
+    """
+    Sends files in chunks of ``chunk_size`` bytes through an upload session,
+    resuming from the offset known by the server after a failure.
+
+    .. code:: python
+
+        from mattermostautodriver.uploader import Uploader
+
+        file_info = Uploader(driver.client).upload("/tmp/archive.zip", channel_id=channel_id)
+    """
+
+    def upload(self, path, channel_id=None, filename=None, upload_type=None, upload_id=None, progress=None):
+        """
+        Upload the file at ``path``.
+
+        :param path: The path of the file to upload
+        :param channel_id: The channel the file is uploaded to, not needed for ``import`` uploads
+        :param filename: The name of the file on the server, defaults to the name of the file in ``path``
+        :param upload_type: The type of upload session (``attachment`` or ``import``), defaults to ``attachment``
+        :param upload_id: The id of an existing upload session to resume instead of creating a new one
+        :param progress: Optional callable called after every chunk with the number of bytes
+            uploaded so far and the size of the file
+        :return: The FileInfo of the uploaded file
+        """
+        if upload_id is None:
+            # Uploads.create_upload doesn't expose the session type needed for import uploads
+            session = self.client.post(
+                "/api/v4/uploads", options=self._session_options(path, channel_id, filename, upload_type)
+            )
+        else:
+            session = self.uploads.get_upload(upload_id)
+
+        upload_id = session["id"]
+        offset = session.get("file_offset", 0)
+        size = session["file_size"]
+        failures = 0
+
+        with open(path, "rb") as fh:
+            data = self._map_file(fh, size)
+            try:
+                while True:
+                    if offset is None:
+                        # The server appends whatever it receives, so we need to know
+                        # how much of the file it has before sending anything else
+                        time.sleep(self.retry_delay)
+                        try:
+                            offset = self.uploads.get_upload(upload_id).get("file_offset", 0)
+                        except Exception as e:
+                            failures += 1
+                            self._handle_failure(e, failures, upload_id)
+                            continue
+
+                    end = min(offset + self.chunk_size, size)
+                    try:
+                        response = self.client.make_request(
+                            "post", f"/api/v4/uploads/{upload_id}", content=data[offset:end]
+                        )
+                    except Exception as e:
+                        failures += 1
+                        self._handle_failure(e, failures, upload_id)
+                        offset = None
+                        continue
+
+                    failures = 0
+                    offset = end
+
+                    if progress is not None:
+                        progress(offset, size)
+
+                    # The server replies with 204 until the last chunk is received
+                    if response.status_code != 204:
+                        return self.client.decode_json(response)
+            finally:
+                if isinstance(data, mmap.mmap):
+                    data.close()
+
+
+class AsyncUploader(BaseUploader):
+    """
+    Asynchronous version of :class:`Uploader`.
+
+    Note that reading the file is done synchronously.
+
+    .. code:: python
+
+        from mattermostautodriver.uploader import AsyncUploader
+
+        file_info = await AsyncUploader(driver.client).upload("/tmp/archive.zip", channel_id=channel_id)
+    """
+
+    async def upload(self, path, channel_id=None, filename=None, upload_type=None, upload_id=None, progress=None):
+        """
+        Upload the file at ``path``.
+
+        :param path: The path of the file to upload
+        :param channel_id: The channel the file is uploaded to, not needed for ``import`` uploads
+        :param filename: The name of the file on the server, defaults to the name of the file in ``path``
+        :param upload_type: The type of upload session (``attachment`` or ``import``), defaults to ``attachment``
+        :param upload_id: The id of an existing upload session to resume instead of creating a new one
+        :param progress: Optional callable called after every chunk with the number of bytes
+            uploaded so far and the size of the file
+        :return: The FileInfo of the uploaded file
+        """
+        if upload_id is None:
+            # Uploads.create_upload doesn't expose the session type needed for import uploads
+            session = await self.client.post(
+                "/api/v4/uploads", options=self._session_options(path, channel_id, filename, upload_type)
+            )
+        else:
+            session = await self.uploads.get_upload(upload_id)
+
+        upload_id = session["id"]
+        offset = session.get("file_offset", 0)
+        size = session["file_size"]
+        failures = 0
+
+        with open(path, "rb") as fh:
+            data = self._map_file(fh, size)
+            try:
+                while True:
+                    if offset is None:
+                        # The server appends whatever it receives, so we need to know
+                        # how much of the file it has before sending anything else
+                        await asyncio.sleep(self.retry_delay)
+                        try:
+                            offset = (await self.uploads.get_upload(upload_id)).get("file_offset", 0)
+                        except Exception as e:
+                            failures += 1
+                            self._handle_failure(e, failures, upload_id)
+                            continue
+
+                    end = min(offset + self.chunk_size, size)
+                    try:
+                        response = await self.client.make_request(
+                            "post", f"/api/v4/uploads/{upload_id}", content=data[offset:end]
+                        )
+                    except Exception as e:
+                        failures += 1
+                        self._handle_failure(e, failures, upload_id)
+                        offset = None
+                        continue
+
+                    failures = 0
+                    offset = end
+
+                    if progress is not None:
+                        progress(offset, size)
+
+                    # The server replies with 204 until the last chunk is received
+                    if response.status_code != 204:
+                        return self.client.decode_json(response)
+            finally:
+                if isinstance(data, mmap.mmap):
+                    data.close()
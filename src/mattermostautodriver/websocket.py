@@ -1,14 +1,138 @@
-import json
 import ssl
 import asyncio
 import logging
+import re
 import time
+from collections import deque
 
 import aiohttp
 
+from .codec import get_codec
+from .constants import DROPPABLE_EVENTS
+from .tracing import NOOP_SPAN, NoOpTracer
+
 log = logging.getLogger("mattermostautodriver.websocket")
 log.setLevel(logging.INFO)
 
+_EVENT_FIELD = re.compile(r'"event"\s*:\s*"([^"]*)"')
+
+
+def peek_event(message):
+    """
+    Read the event type of a websocket message without decoding it.
+
+    :param message: A raw websocket message
+    :return: The value of the ``event`` field or None if there is none, e.g. for replies to actions
+    """
+    match = _EVENT_FIELD.search(message)
+    return match.group(1) if match else None
+
+
+class EventQueue:
+    """
+    Bounded queue of the websocket messages waiting for the event handler, used when the
+    ``websocket_workers`` option is set, with a policy for the messages received when it is full:
+
+    - ``block`` - wait for a worker to take a message, which stops receiving messages meanwhile
+    - ``drop_oldest`` - drop the message received first
+    - ``drop_by_type`` - drop the new message if its event is in ``droppable_events``, otherwise the
+      oldest queued message whose event is, or wait if there is none
+    """
+
+    OVERFLOW_POLICIES = ("block", "drop_oldest", "drop_by_type")
+
+    def __init__(self, maxsize, overflow="block", droppable_events=DROPPABLE_EVENTS):
+        """
+        :param maxsize: The maximum number of messages queued, at least 1
+        :param overflow: The policy applied when the queue is full, see above
+        :param droppable_events: The event types dropped first with the ``drop_by_type`` policy
+        """
+        if maxsize < 1:
+            raise ValueError(f"The queue size must be at least 1, got {maxsize!r}")
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {overflow!r}, expected one of {self.OVERFLOW_POLICIES}")
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.droppable_events = frozenset(droppable_events)
+        # Entries are (message, event type, time received), the event type is only read for drop_by_type
+        self._items = deque()
+        self._changed = asyncio.Condition()
+        self.dropped = 0
+        self.max_depth = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+    def __len__(self):
+        return len(self._items)
+
+    def _make_room(self, event):
+        """
+        Drop a message as allowed by the overflow policy.
+
+        :return: True if room was made, None if the new message must be dropped, False to wait
+        """
+        if self.overflow == "drop_oldest":
+            self._items.popleft()
+        elif self.overflow == "drop_by_type":
+            if event in self.droppable_events:
+                return None
+            for item in self._items:
+                if item[1] in self.droppable_events:
+                    self._items.remove(item)
+                    break
+            else:
+                return False
+        else:
+            return False
+        self.dropped += 1
+        return True
+
+    async def put(self, message):
+        """
+        Queue ``message``, applying the overflow policy if the queue is full.
+        """
+        event = peek_event(message) if self.overflow == "drop_by_type" else None
+        async with self._changed:
+            while len(self._items) >= self.maxsize:
+                made_room = self._make_room(event)
+                if made_room is None:
+                    self.dropped += 1
+                    return
+                if not made_room:
+                    await self._changed.wait()
+            self._items.append((message, event, time.monotonic()))
+            self.max_depth = max(self.max_depth, len(self._items))
+            self._changed.notify_all()
+
+    async def get(self):
+        """
+        :return: The oldest queued message, waiting for one if the queue is empty
+        """
+        async with self._changed:
+            while not self._items:
+                await self._changed.wait()
+            message, _, received = self._items.popleft()
+            self._changed.notify_all()
+        self.last_lag = time.monotonic() - received
+        self.max_lag = max(self.max_lag, self.last_lag)
+        return message
+
+    def stats(self):
+        """
+        :return: A dict with the number of messages queued (``depth``), the highest number seen (``max_depth``),
+            the number of messages ``dropped``, the seconds waited by the oldest queued message (``lag``)
+            and by the last and slowest messages taken from the queue (``last_lag`` and ``max_lag``)
+        """
+        lag = time.monotonic() - self._items[0][2] if self._items else 0.0
+        return {
+            "depth": len(self._items),
+            "max_depth": self.max_depth,
+            "dropped": self.dropped,
+            "lag": lag,
+            "last_lag": self.last_lag,
+            "max_lag": self.max_lag,
+        }
+
 
 class Websocket:
     def __init__(self, options, token):
@@ -16,8 +140,19 @@ class Websocket:
         if options["debug"]:
             log.setLevel(logging.DEBUG)
         self._token = token
+        self._codec = get_codec(options.get("json_backend", "auto"))
+        self._tracer = options.get("tracer") or NoOpTracer()
+        self._tracing = getattr(self._tracer, "enabled", True)
         self._alive = False
         self._last_msg = 0
+        self._workers = options.get("websocket_workers", 0)
+        self.queue = None
+        if self._workers:
+            self.queue = EventQueue(
+                options.get("websocket_queue_size", 1000),
+                options.get("websocket_overflow", "block"),
+                options.get("websocket_droppable_events", DROPPABLE_EVENTS),
+            )
 
     async def connect(self, event_handler):
         """
@@ -25,6 +160,10 @@ class Websocket:
         When the authentication has finished, start the loop listening for messages,
         sending a ping to the server to keep the connection alive.
 
+        With the ``websocket_workers`` option, messages are put in :attr:`queue` and passed to the event handler
+        by that many tasks, so a slow event handler doesn't delay receiving messages and the heartbeats.
+        Messages may then be handled out of order, and exceptions raised by the event handler are logged.
+
         :param event_handler: Every websocket event will be passed there. Takes one argument.
         :type event_handler: Function(message)
         :return:
@@ -45,6 +184,15 @@ class Websocket:
 
         self._alive = True
 
+        workers = [asyncio.create_task(self._worker(event_handler)) for _ in range(self._workers)]
+        try:
+            await self._connect_loop(url, context, event_handler)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _connect_loop(self, url, context, event_handler):
         while True:
             try:
                 kw_args = {}
@@ -84,7 +232,10 @@ class Websocket:
             while self._alive:
                 message = await websocket.receive_str()
                 self._last_msg = time.time()
-                await event_handler(message)
+                if self.queue is not None:
+                    await self.queue.put(message)
+                else:
+                    await self._dispatch(event_handler, message)
         finally:
             log.debug("cancelling heartbeat task")
             if not keep_alive.done():
@@ -96,6 +247,37 @@ class Websocket:
             except Exception:
                 log.debug("heartbeat task finished during websocket shutdown")
 
+    async def _dispatch(self, event_handler, message):
+        with self._dispatch_span(message):
+            await event_handler(message)
+
+    async def _worker(self, event_handler):
+        """
+        Pass the messages of the queue to the event handler until cancelled.
+        """
+        while True:
+            message = await self.queue.get()
+            try:
+                await self._dispatch(event_handler, message)
+            except Exception:
+                log.exception("Websocket event handler failed")
+
+    def stats(self):
+        """
+        :return: The statistics of the event queue (see :meth:`EventQueue.stats`),
+            or None without the ``websocket_workers`` option
+        """
+        return self.queue.stats() if self.queue is not None else None
+
+    def _dispatch_span(self, message):
+        """
+        :return: A span for the dispatch of ``message`` to the event handler from the configured tracer
+        """
+        if not self._tracing:
+            return NOOP_SPAN
+        event = peek_event(message)
+        return self._tracer.start_span(f"websocket {event}", {"mattermost.event": event or ""})
+
     async def _do_heartbeats(self, websocket):
         """
         This is a little complicated, but we only need to pong the websocket if
@@ -126,11 +308,13 @@ class Websocket:
         when connecting to the websocket.
         """
         log.debug("Authenticating websocket")
-        json_data = json.dumps({"seq": 1, "action": "authentication_challenge", "data": {"token": self._token}})
+        json_data = self._codec.dumps(
+            {"seq": 1, "action": "authentication_challenge", "data": {"token": self._token}}
+        ).decode("utf-8")
         await websocket.send_str(json_data)
         while True:
             message = await websocket.receive_str()
-            status = json.loads(message)
+            status = self._codec.loads(message)
             log.debug(status)
             # We want to pass the events to the event_handler already
             # because the hello event could arrive before the authentication ok response